@@ -0,0 +1,32 @@
+# backend/tasks/authentication.py
+
+"""Token authentication with a short-lived cache in front of the DB.
+
+Stock TokenAuthentication resolves every request with
+Token.objects.select_related('user').get(key=...), a database round-trip
+per API call before any view code runs. Tokens change rarely, so the
+resolved (user, token) pair is memoized in the configured cache for a
+few minutes; within the TTL, authenticated requests cost no auth query.
+Revoking a token or deactivating a user takes effect once the entry
+expires.
+"""
+
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+
+TOKEN_CACHE_TTL = 300  # seconds
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication that serves repeat lookups from the cache."""
+
+    def authenticate_credentials(self, key):
+        cache_key = f'tok:{key}'
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        user, token = super().authenticate_credentials(key)
+        # Failures raise above and are never cached, so a bad key
+        # cannot shadow a token created with the same value later.
+        cache.set(cache_key, (user, token), TOKEN_CACHE_TTL)
+        return user, token
@@ -0,0 +1,64 @@
+# backend/tasks/history.py
+
+import contextlib
+import threading
+
+from django.db import transaction
+
+BATCH_SIZE = 10_000
+
+_buffer = threading.local()
+
+
+def record_stage_change(deal, to_stage, changed_by=None, notes=''):
+    """Queue a DealStageHistory row for the current transaction.
+
+    Rows accumulate in a thread-local buffer and are written with one
+    bulk_create when the surrounding transaction commits, so an import
+    that moves 10k deal stages pays a couple of multi-row inserts
+    instead of 10k. Outside an atomic block Django runs on_commit
+    callbacks immediately, so plain single-change callers still see
+    their history row as soon as this returns.
+    """
+    from .models import DealStageHistory
+
+    rows = getattr(_buffer, 'rows', None)
+    if rows is None:
+        rows = _buffer.rows = []
+    rows.append(DealStageHistory(
+        deal_id=deal.pk,
+        from_stage=deal.stage,
+        to_stage=to_stage,
+        changed_by=changed_by,
+        notes=notes,
+    ))
+    # Register the flush when the buffer goes non-empty; appending after
+    # registration would lose rows outside an atomic block, where
+    # on_commit fires immediately.
+    if len(rows) == 1:
+        transaction.on_commit(flush_history)
+
+
+def flush_history():
+    """Write all buffered history rows now.
+
+    Safe to call at any point (it is a no-op on an empty buffer); views
+    that read history back within the same transaction can call it for
+    immediate visibility instead of waiting for commit.
+    """
+    from .models import DealStageHistory
+
+    rows = getattr(_buffer, 'rows', None)
+    if not rows:
+        return
+    _buffer.rows = []
+    DealStageHistory.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+
+@contextlib.contextmanager
+def buffered_history():
+    """Scope a bulk operation and flush whatever it queued on exit."""
+    try:
+        yield
+    finally:
+        flush_history()
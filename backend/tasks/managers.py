@@ -0,0 +1,263 @@
+# backend/tasks/managers.py
+
+from django.db import models
+from django.db.models.functions import Coalesce, Now
+
+from .utils import normalize_phone
+
+
+class CompanyQuerySet(models.QuerySet):
+    """Queryset helpers for company pages and aggregate maintenance."""
+
+    def by_phone(self, raw):
+        """Indexed phone lookup tolerant of spaces and dashes in the input."""
+        return self.filter(phone_normalized=normalize_phone(raw))
+
+    def with_active_deals(self):
+        # One batched IN (...) query for the whole page; the
+        # active_deals property serves the prefetched list instead of
+        # filtering deals per company. Prefetched under a private name
+        # because the property itself occupies `active_deals`.
+        Deal = self.model._meta.apps.get_model('tasks', 'Deal')
+        return self.prefetch_related(
+            models.Prefetch(
+                'deals',
+                queryset=Deal.objects.filter(is_active=True).exclude(
+                    stage__in=['closed_won', 'closed_lost']
+                ),
+                to_attr='_active_deals',
+            )
+        )
+
+    def refresh_aggregates(self, company_pks):
+        """Recompute the denormalized aggregate columns for given companies.
+
+        One UPDATE with correlated subqueries however many rows changed;
+        the receivers in signals.py call this whenever a contact or deal
+        write may have shifted a company's numbers. Bulk ingestion paths
+        skip signals, so importers should call this themselves with the
+        touched company pks.
+        """
+        if not company_pks:
+            return 0
+        Contact = self.model._meta.apps.get_model('tasks', 'Contact')
+        Deal = self.model._meta.apps.get_model('tasks', 'Deal')
+
+        def grouped(qs, expr):
+            return models.Subquery(
+                qs.order_by().values('company').annotate(agg=expr).values('agg')
+            )
+
+        contacts = Contact.objects.filter(
+            company=models.OuterRef('pk'), is_active=True
+        )
+        deals = Deal.objects.filter(
+            company=models.OuterRef('pk'), is_active=True
+        )
+        open_deals = deals.exclude(
+            stage__in=['closed_won', 'closed_lost']
+        )
+        return self.filter(pk__in=company_pks).update(
+            contact_count=Coalesce(grouped(contacts, models.Count('id')), 0),
+            deal_count=Coalesce(grouped(deals, models.Count('id')), 0),
+            active_deal_count=Coalesce(grouped(open_deals, models.Count('id')), 0),
+            total_deal_value=Coalesce(
+                grouped(deals, models.Sum('amount')),
+                models.Value(0),
+                output_field=models.DecimalField(max_digits=15, decimal_places=2),
+            ),
+        )
+
+
+class BulkManager(models.Manager):
+    """Manager exposing batched ingestion paths for seeders and importers.
+
+    `Model.save()` validates and writes one row per call, so loading N
+    rows costs N round-trips. These helpers validate up front in Python
+    and hand the whole list to `bulk_create`/`bulk_update`, collapsing
+    the writes into a handful of multi-row statements. Callers should
+    wrap an ingest in `transaction.atomic()` so each batch commits once
+    instead of per statement.
+
+    Note that `bulk_create` skips `save()` entirely: model-level save
+    hooks (deal code allocation, next_occurrence precomputation) do not
+    run, so this path is for rows prepared fully in memory.
+    """
+
+    def bulk_insert(self, objs, batch_size=10_000, ignore_conflicts=False):
+        for obj in objs:
+            obj.full_clean()
+        return self.bulk_create(
+            objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts
+        )
+
+    def bulk_update_fast(self, objs, fields, batch_size=10_000):
+        return self.bulk_update(objs, fields, batch_size=batch_size)
+
+
+class CompanyManager(BulkManager.from_queryset(CompanyQuerySet)):
+    """Default Company manager: bulk ingestion plus aggregate upkeep.
+
+    Pre-joins the user FKs the detail serializer always renders.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'created_by', 'assigned_to'
+        )
+
+
+class ContactQuerySet(models.QuerySet):
+    """Queryset helpers for relations contact pages display."""
+
+    def by_phone(self, raw):
+        """Indexed phone lookup tolerant of spaces and dashes in the input."""
+        return self.filter(phone_normalized=normalize_phone(raw))
+
+    def with_recent_interactions(self):
+        # Two queries total however many contacts the page renders; the
+        # recent_interactions property slices the prefetched list
+        # instead of querying per contact. Intended for DRF
+        # get_queryset on endpoints whose serializer exposes
+        # recent_interactions.
+        Interaction = self.model._meta.apps.get_model('tasks', 'Interaction')
+        return self.prefetch_related(
+            models.Prefetch(
+                'interactions',
+                queryset=Interaction.objects.filter(
+                    is_active=True
+                ).order_by('-interaction_date'),
+                to_attr='_recent',
+            )
+        )
+
+
+class DealQuerySet(models.QuerySet):
+    """Queryset helpers for annotations deal pages display."""
+
+    def with_days_in_stage(self):
+        # One MAX join for the whole page; the days_in_stage property
+        # reads the annotation instead of querying history per deal
+        return self.annotate(
+            _last_stage_change=models.Max('stage_history__changed_at')
+        )
+
+
+class ContactManager(BulkManager.from_queryset(ContactQuerySet)):
+    """Default Contact manager: bulk ingestion plus prefetch helpers.
+
+    Pre-joins the FKs the detail serializer always renders.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'company', 'created_by', 'assigned_to'
+        )
+
+
+class DealManager(BulkManager.from_queryset(DealQuerySet)):
+    """Default manager that pre-joins the FKs every deal listing touches."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'company', 'contact', 'assigned_to'
+        )
+
+
+class TaskQuerySet(models.QuerySet):
+    """Queryset helpers computing task metrics in the database.
+
+    Annotating completion rate and overdue age lets dashboards sort and
+    slice in SQL (e.g. "top 50 most overdue") so only the limited rows
+    ever leave the database, instead of loading every task and ranking
+    in Python.
+    """
+
+    def with_metrics(self):
+        return self.annotate(
+            completion_rate_db=models.Case(
+                models.When(
+                    estimated_hours__gt=0,
+                    actual_hours__isnull=False,
+                    then=models.F('actual_hours') * 100.0
+                    / models.F('estimated_hours'),
+                ),
+                default=models.Value(0.0),
+                output_field=models.FloatField(),
+            ),
+            # Age as a duration rather than ExtractDay: sqlite has no
+            # native interval type for Extract, while a duration orders
+            # and filters correctly on both vendors.
+            overdue_for_db=models.Case(
+                models.When(
+                    due_date__lt=Now(),
+                    is_open=True,
+                    then=models.ExpressionWrapper(
+                        Now() - models.F('due_date'),
+                        output_field=models.DurationField(),
+                    ),
+                ),
+                default=None,
+                output_field=models.DurationField(),
+            ),
+        )
+
+
+class TaskManager(BulkManager.from_queryset(TaskQuerySet)):
+    """Default manager that pre-joins the FKs every task listing touches."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'company', 'contact', 'deal', 'assigned_to', 'created_by'
+        )
+
+
+class InteractionManager(BulkManager):
+    """Default manager that pre-joins the FKs every interaction listing touches."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'company', 'contact', 'deal', 'created_by'
+        )
+
+
+# List managers: the list serializers only render narrow columns, so the
+# wide narrative fields are deferred and never leave the database.
+
+class CompanyListManager(models.Manager.from_queryset(CompanyQuerySet)):
+    """Company manager for list endpoints that skips wide text columns."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer('address', 'notes', 'tags')
+
+
+class ContactListManager(models.Manager.from_queryset(ContactQuerySet)):
+    """Contact manager for list endpoints that skips wide text columns."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer(
+            'notes', 'tags', 'social_linkedin', 'social_twitter'
+        )
+
+
+class DealListManager(DealManager):
+    """Deal manager for list endpoints that skips wide text columns."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer('notes', 'lost_notes', 'tags')
+
+
+class TaskListManager(TaskManager):
+    """Task manager for list endpoints that skips wide text columns."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer(
+            'description', 'completion_notes', 'tags'
+        )
+
+
+class InteractionListManager(InteractionManager):
+    """Interaction manager for list endpoints that skips wide text columns."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer('description', 'follow_up_notes')
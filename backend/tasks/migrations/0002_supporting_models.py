@@ -3,7 +3,7 @@
 
 from django.db import migrations, models
 import django.db.models.deletion
-import uuid
+import tasks.utils
 
 
 class Migration(migrations.Migration):
@@ -19,21 +19,22 @@ class Migration(migrations.Migration):
             fields=[
                 ('created_at', models.DateTimeField(auto_now_add=True)),
                 ('updated_at', models.DateTimeField(auto_now=True)),
-                ('is_active', models.BooleanField(db_index=True, default=True)),
+                ('is_active', models.BooleanField(default=True)),
                 ('deleted_at', models.DateTimeField(blank=True, editable=False, null=True)),
-                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('public_id', models.UUIDField(default=tasks.utils.uuid7, editable=False, unique=True)),
                 ('interaction_type', models.CharField(choices=[('call', 'Phone Call'), ('email', 'Email'), ('meeting', 'Meeting'), ('note', 'Note'), ('demo', 'Product Demo'), ('proposal', 'Proposal Sent')], max_length=20)),
                 ('subject', models.CharField(max_length=200)),
                 ('description', models.TextField()),
-                ('interaction_date', models.DateTimeField(db_index=True)),
+                ('interaction_date', models.DateTimeField()),
                 ('duration_minutes', models.PositiveIntegerField(blank=True, null=True)),
                 ('requires_follow_up', models.BooleanField(default=False)),
                 ('follow_up_date', models.DateTimeField(blank=True, null=True)),
                 ('follow_up_notes', models.TextField(blank=True)),
-                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='interactions', to='tasks.company')),
-                ('contact', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='interactions', to='tasks.contact')),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='interactions', to='tasks.company')),
+                ('contact', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='interactions', to='tasks.contact')),
                 ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='interactions', to='auth.user')),
-                ('deal', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='interactions', to='tasks.deal')),
+                ('deal', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='interactions', to='tasks.deal')),
             ],
             options={
                 'ordering': ['-interaction_date'],
@@ -48,13 +49,14 @@ class Migration(migrations.Migration):
         migrations.CreateModel(
             name='DealStageHistory',
             fields=[
-                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('public_id', models.UUIDField(default=tasks.utils.uuid7, editable=False, unique=True)),
                 ('from_stage', models.CharField(choices=[('lead', 'Lead'), ('qualified', 'Qualified'), ('proposal', 'Proposal'), ('negotiation', 'Negotiation'), ('closed_won', 'Closed Won'), ('closed_lost', 'Closed Lost'), ('on_hold', 'On Hold')], max_length=20)),
                 ('to_stage', models.CharField(choices=[('lead', 'Lead'), ('qualified', 'Qualified'), ('proposal', 'Proposal'), ('negotiation', 'Negotiation'), ('closed_won', 'Closed Won'), ('closed_lost', 'Closed Lost'), ('on_hold', 'On Hold')], max_length=20)),
                 ('changed_at', models.DateTimeField(auto_now_add=True)),
                 ('notes', models.TextField(blank=True)),
                 ('changed_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to='auth.user')),
-                ('deal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stage_history', to='tasks.deal')),
+                ('deal', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='stage_history', to='tasks.deal')),
             ],
             options={
                 'verbose_name_plural': 'Deal Stage Histories',
@@ -0,0 +1,26 @@
+# backend/tasks/migrations/0004_task_overdue_partial_index.py
+
+from django.db import migrations, models
+
+from ._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0003_migrate_existing_data'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(
+                condition=models.Q(('status__in', ['pending', 'in_progress'])),
+                fields=['status', 'due_date'],
+                name='task_status_due_idx'
+            ),
+        ),
+    ]
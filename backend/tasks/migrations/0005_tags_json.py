@@ -0,0 +1,60 @@
+# backend/tasks/migrations/0005_tags_json.py
+
+from django.db import migrations
+
+TAGGED_MODELS = ('Company', 'Contact', 'Deal', 'Task')
+
+
+def split_csv_tags(apps, schema_editor):
+    """Convert legacy comma-separated tag strings into JSON lists."""
+    alias = schema_editor.connection.alias
+    for model_name in TAGGED_MODELS:
+        model = apps.get_model('tasks', model_name)
+        batch = []
+        for obj in model.objects.using(alias).only('id', 'tags').iterator(chunk_size=2000):
+            if not isinstance(obj.tags, str):
+                continue
+            obj.tags = [tag.strip() for tag in obj.tags.split(',') if tag.strip()]
+            batch.append(obj)
+            if len(batch) >= 5000:
+                model.objects.using(alias).bulk_update(batch, ['tags'], batch_size=5000)
+                batch.clear()
+        if batch:
+            model.objects.using(alias).bulk_update(batch, ['tags'], batch_size=5000)
+
+
+def add_gin_indexes(apps, schema_editor):
+    """Index tag containment lookups on PostgreSQL.
+
+    GIN turns tag filters into indexed set-containment instead of a
+    sequential scan with LIKE. No equivalent exists on SQLite, where the
+    column stays a plain JSON text column.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name in TAGGED_MODELS:
+        table = apps.get_model('tasks', model_name)._meta.db_table
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {table}_tags_gin_idx '
+            f'ON {table} USING GIN ((tags::jsonb))'
+        )
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name in TAGGED_MODELS:
+        table = apps.get_model('tasks', model_name)._meta.db_table
+        schema_editor.execute(f'DROP INDEX IF EXISTS {table}_tags_gin_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_overdue_partial_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(split_csv_tags, migrations.RunPython.noop),
+        migrations.RunPython(add_gin_indexes, drop_gin_indexes),
+    ]
@@ -0,0 +1,68 @@
+# backend/tasks/migrations/0006_soft_delete_partial_indexes.py
+
+from django.db import migrations, models
+
+from ._operations import AddIndexConcurrently
+
+_LIVE = models.Q(('deleted_at__isnull', True), ('is_active', True))
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0005_tags_json'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='company',
+            index=models.Index(
+                condition=_LIVE,
+                fields=['created_at'],
+                name='tasks_comp_live_created_idx'
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='contact',
+            index=models.Index(
+                condition=_LIVE,
+                fields=['created_at'],
+                name='tasks_cont_live_created_idx'
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='deal',
+            index=models.Index(
+                condition=_LIVE,
+                fields=['created_at'],
+                name='tasks_deal_live_created_idx'
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='deal',
+            index=models.Index(
+                condition=_LIVE,
+                fields=['stage', 'expected_close_date'],
+                name='tasks_deal_live_stage_idx'
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(
+                condition=_LIVE,
+                fields=['created_at'],
+                name='tasks_task_live_created_idx'
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='interaction',
+            index=models.Index(
+                condition=_LIVE,
+                fields=['created_at'],
+                name='tasks_inter_live_created_idx'
+            ),
+        ),
+    ]
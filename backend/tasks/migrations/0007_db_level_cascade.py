@@ -0,0 +1,72 @@
+# backend/tasks/migrations/0007_db_level_cascade.py
+
+from django.db import migrations
+
+# (table, column, referenced table) for every FK moved from Django-side
+# CASCADE to on_delete=DO_NOTHING. The cascade now happens in the database,
+# where it is a single set-based delete instead of Django's per-row
+# collector walking the object graph in Python.
+CASCADE_FKS = [
+    ('tasks_task', 'company_id', 'tasks_company'),
+    ('tasks_task', 'contact_id', 'tasks_contact'),
+    ('tasks_task', 'deal_id', 'tasks_deal'),
+    ('tasks_task', 'parent_task_id', 'tasks_task'),
+    ('tasks_interaction', 'company_id', 'tasks_company'),
+    ('tasks_interaction', 'contact_id', 'tasks_contact'),
+    ('tasks_interaction', 'deal_id', 'tasks_deal'),
+    ('tasks_dealstagehistory', 'deal_id', 'tasks_deal'),
+]
+
+_FIND_FK = """
+    SELECT con.conname
+    FROM pg_constraint con
+    JOIN pg_class rel ON rel.oid = con.conrelid
+    JOIN pg_attribute att
+        ON att.attrelid = con.conrelid AND att.attnum = ANY(con.conkey)
+    WHERE con.contype = 'f' AND rel.relname = %s AND att.attname = %s
+"""
+
+
+def _recreate_fks(schema_editor, on_delete_clause):
+    with schema_editor.connection.cursor() as cursor:
+        for table, column, ref_table in CASCADE_FKS:
+            cursor.execute(_FIND_FK, [table, column])
+            row = cursor.fetchone()
+            if row is None:
+                continue
+            cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT {row[0]}')
+            cursor.execute(
+                f'ALTER TABLE {table} ADD CONSTRAINT {row[0]} '
+                f'FOREIGN KEY ({column}) REFERENCES {ref_table} (id) '
+                f'{on_delete_clause} DEFERRABLE INITIALLY DEFERRED'
+            )
+
+
+def push_cascade_to_db(apps, schema_editor):
+    """Recreate the high-fanout FK constraints with ON DELETE CASCADE.
+
+    PostgreSQL-only: SQLite cannot alter constraints in place, and there
+    hard deletes of rows with dependants will now raise IntegrityError
+    instead of cascading row-by-row — acceptable since the application
+    soft-deletes everywhere.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    _recreate_fks(schema_editor, 'ON DELETE CASCADE')
+
+
+def revert_cascade_to_db(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    _recreate_fks(schema_editor, 'ON DELETE NO ACTION')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_soft_delete_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(push_cascade_to_db, revert_cascade_to_db),
+    ]
@@ -0,0 +1,101 @@
+# backend/tasks/migrations/0008_choice_column_enums.py
+
+from django.db import migrations
+
+# Enum type -> the (model, field) columns stored with that type. Choices are
+# read from the first listed field's historical definition so the enum always
+# matches what the application writes.
+ENUM_COLUMNS = {
+    'tasks_industry_enum': [('Company', 'industry')],
+    'tasks_company_size_enum': [('Company', 'company_size')],
+    'tasks_salutation_enum': [('Contact', 'salutation')],
+    'tasks_source_enum': [('Contact', 'source')],
+    'tasks_currency_enum': [('Deal', 'currency')],
+    'tasks_deal_stage_enum': [
+        ('Deal', 'stage'),
+        ('DealStageHistory', 'from_stage'),
+        ('DealStageHistory', 'to_stage'),
+    ],
+    'tasks_lost_reason_enum': [('Deal', 'lost_reason')],
+    'tasks_forecast_enum': [('Deal', 'forecast_category')],
+    'tasks_task_type_enum': [('Task', 'task_type')],
+    'tasks_task_status_enum': [('Task', 'status')],
+    'tasks_task_priority_enum': [('Task', 'priority')],
+    'tasks_interaction_type_enum': [('Interaction', 'interaction_type')],
+}
+
+
+def _quote(value):
+    return "'" + value.replace("'", "''") + "'"
+
+
+def create_enums(apps, schema_editor):
+    """Store choice columns as PostgreSQL ENUMs instead of VARCHAR.
+
+    An enum value is 4 bytes with no per-value length header, so composite
+    indexes like (stage, expected_close_date) and (status, completed_date)
+    pack far more entries per leaf page than with up-to-20-byte strings.
+    The Django fields stay CharFields: equality filters compare text
+    literals against the enum transparently, and SQLite keeps plain text.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for enum_name, columns in ENUM_COLUMNS.items():
+        model = apps.get_model('tasks', columns[0][0])
+        field = model._meta.get_field(columns[0][1])
+        values = [choice for choice, _ in field.choices]
+        if field.blank and '' not in values:
+            values.append('')
+        schema_editor.execute(
+            f"CREATE TYPE {enum_name} AS ENUM ({', '.join(_quote(v) for v in values)})"
+        )
+        for model_name, field_name in columns:
+            target = apps.get_model('tasks', model_name)._meta.get_field(field_name)
+            table = apps.get_model('tasks', model_name)._meta.db_table
+            column = target.column
+            schema_editor.execute(
+                f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT'
+            )
+            schema_editor.execute(
+                f'ALTER TABLE {table} ALTER COLUMN {column} '
+                f'TYPE {enum_name} USING {column}::text::{enum_name}'
+            )
+            if isinstance(target.default, str):
+                schema_editor.execute(
+                    f'ALTER TABLE {table} ALTER COLUMN {column} '
+                    f'SET DEFAULT {_quote(target.default)}::{enum_name}'
+                )
+
+
+def drop_enums(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for enum_name, columns in ENUM_COLUMNS.items():
+        for model_name, field_name in columns:
+            model = apps.get_model('tasks', model_name)
+            table = model._meta.db_table
+            field = model._meta.get_field(field_name)
+            schema_editor.execute(
+                f'ALTER TABLE {table} ALTER COLUMN {field.column} DROP DEFAULT'
+            )
+            schema_editor.execute(
+                f'ALTER TABLE {table} ALTER COLUMN {field.column} '
+                f'TYPE varchar({field.max_length}) USING {field.column}::text'
+            )
+            if isinstance(field.default, str):
+                schema_editor.execute(
+                    f'ALTER TABLE {table} ALTER COLUMN {field.column} '
+                    f'SET DEFAULT {_quote(field.default)}'
+                )
+        schema_editor.execute(f'DROP TYPE {enum_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_db_level_cascade'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_enums, drop_enums),
+    ]
@@ -0,0 +1,39 @@
+# backend/tasks/migrations/0009_check_constraints.py
+
+from django.db import migrations, models
+
+_CLOSED = models.Q(('stage__in', ['closed_won', 'closed_lost']))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_choice_column_enums'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='deal',
+            constraint=models.CheckConstraint(
+                check=models.Q(('probability__gte', 0), ('probability__lte', 100)),
+                name='deal_probability_range'
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='deal',
+            constraint=models.CheckConstraint(
+                check=(_CLOSED & models.Q(('actual_close_date__isnull', False))) | ~_CLOSED,
+                name='deal_closed_has_date'
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='task',
+            constraint=models.CheckConstraint(
+                check=(
+                    models.Q(('completed_date__isnull', False), ('status', 'completed'))
+                    | ~models.Q(('status', 'completed'))
+                ),
+                name='task_completed_has_date'
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# backend/tasks/migrations/0010_task_next_occurrence.py
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0009_check_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='next_occurrence',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, help_text='Next run precomputed from recurrence_pattern at save time', null=True),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# backend/tasks/migrations/0011_brin_time_indexes.py
+
+from django.db import migrations
+
+# (table, timestamp column) pairs that dashboards scan by time bucket.
+BRIN_COLUMNS = [
+    ('tasks_company', 'created_at'),
+    ('tasks_contact', 'created_at'),
+    ('tasks_deal', 'created_at'),
+    ('tasks_task', 'created_at'),
+    ('tasks_interaction', 'interaction_date'),
+    ('tasks_dealstagehistory', 'changed_at'),
+]
+
+
+def add_brin_indexes(apps, schema_editor):
+    """Summarize append-mostly timestamp columns with BRIN on PostgreSQL.
+
+    A BRIN index stores one min/max summary per 32-page range, so it is
+    orders of magnitude smaller than a B-tree while still pruning "last
+    30/90 days" analytical scans down to the matching page ranges. The
+    partial B-trees from 0006 are kept for ORDER BY pagination, which
+    BRIN cannot serve.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in BRIN_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {table}_{column}_brin_idx '
+            f'ON {table} USING BRIN ({column}) WITH (pages_per_range = 32)'
+        )
+
+
+def drop_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in BRIN_COLUMNS:
+        schema_editor.execute(
+            f'DROP INDEX IF EXISTS {table}_{column}_brin_idx'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_task_next_occurrence'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_brin_indexes, drop_brin_indexes),
+    ]
@@ -0,0 +1,74 @@
+# backend/tasks/migrations/0012_attachment_dedup.py
+
+import hashlib
+
+from django.core.files.storage import default_storage
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def dedupe_existing_attachments(apps, schema_editor):
+    """Fold existing task_attachments/ files into content-hashed rows.
+
+    Each distinct file body becomes one Attachment keyed by its SHA-256;
+    tasks pointing at byte-identical copies converge on the same row.
+    Files missing from storage are skipped rather than failing the
+    migration — their tasks simply end up without an attachment, same as
+    a broken FileField path did before.
+    """
+    Task = apps.get_model('tasks', 'Task')
+    Attachment = apps.get_model('tasks', 'Attachment')
+    for task in Task.objects.exclude(attachment='').exclude(
+            attachment__isnull=True).only('id', 'attachment').iterator():
+        name = task.attachment.name
+        if not default_storage.exists(name):
+            continue
+        digest = hashlib.sha256()
+        with default_storage.open(name, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+                digest.update(chunk)
+        attachment, _created = Attachment.objects.get_or_create(
+            hash=digest.hexdigest(),
+            defaults={
+                'file': name,
+                'size': default_storage.size(name),
+                'content_type': '',
+            }
+        )
+        Task.objects.filter(pk=task.pk).update(attachment_ref=attachment.hash)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0011_brin_time_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Attachment',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('hash', models.CharField(help_text='SHA-256 hex digest of the file contents', max_length=64, primary_key=True, serialize=False)),
+                ('file', models.FileField(upload_to='attachments/')),
+                ('size', models.BigIntegerField()),
+                ('content_type', models.CharField(blank=True, max_length=100)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='attachment_ref',
+            field=models.ForeignKey(blank=True, help_text='Related file attachment (deduplicated by content hash)', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='tasks', to='tasks.attachment'),
+        ),
+        migrations.RunPython(dedupe_existing_attachments, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='task',
+            name='attachment',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='attachment_ref',
+            new_name='attachment',
+        ),
+    ]
@@ -0,0 +1,36 @@
+# backend/tasks/migrations/0013_deal_code_counter.py
+
+from django.db import migrations, models
+
+
+def seed_counters(apps, schema_editor):
+    """Start each year's counter at the highest sequence already issued."""
+    Deal = apps.get_model('tasks', 'Deal')
+    DealCodeCounter = apps.get_model('tasks', 'DealCodeCounter')
+    highest = (
+        Deal.objects.exclude(deal_year__isnull=True)
+        .values('deal_year')
+        .annotate(last_seq=models.Max('deal_seq'))
+    )
+    DealCodeCounter.objects.bulk_create(
+        DealCodeCounter(year=row['deal_year'], last_seq=row['last_seq'] or 0)
+        for row in highest
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0012_attachment_dedup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DealCodeCounter',
+            fields=[
+                ('year', models.PositiveSmallIntegerField(primary_key=True, serialize=False)),
+                ('last_seq', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
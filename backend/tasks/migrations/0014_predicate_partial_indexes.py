@@ -0,0 +1,34 @@
+# backend/tasks/migrations/0014_predicate_partial_indexes.py
+
+from django.db import migrations, models
+
+from ._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0013_deal_code_counter'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='deal',
+            index=models.Index(
+                condition=~models.Q(('stage__in', ['closed_won', 'closed_lost'])),
+                fields=['stage', 'expected_close_date'],
+                name='tasks_deal_open_stage_idx'
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='interaction',
+            index=models.Index(
+                condition=models.Q(('is_active', True)),
+                fields=['contact', '-interaction_date'],
+                name='tasks_inter_cont_recent_idx'
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# backend/tasks/migrations/0015_dealstagehistory_timestamps.py
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    """Catch the schema up with DealStageHistory's TimestampMixin base.
+
+    The model has inherited created_at/updated_at all along, but 0002
+    never created the columns, so any INSERT through the ORM failed.
+    """
+
+    dependencies = [
+        ('tasks', '0014_predicate_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dealstagehistory',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='dealstagehistory',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# backend/tasks/migrations/0016_task_completion_notes.py
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0015_dealstagehistory_timestamps'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='completion_notes',
+            field=models.TextField(blank=True, help_text='Notes recorded when the task was completed'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# backend/tasks/migrations/0017_phone_normalized.py
+
+from django.db import migrations, models
+
+from tasks.utils import normalize_phone
+
+BATCH_SIZE = 5_000
+
+
+def backfill_phone_normalized(apps, schema_editor):
+    """Populate the normalized column for rows saved before it existed."""
+    for model_name in ('Company', 'Contact'):
+        model = apps.get_model('tasks', model_name)
+        batch = []
+        rows = model.objects.exclude(phone='').only('id', 'phone')
+        for row in rows.iterator(chunk_size=2000):
+            row.phone_normalized = normalize_phone(row.phone)
+            batch.append(row)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(
+                    batch, ['phone_normalized'], batch_size=BATCH_SIZE
+                )
+                batch.clear()
+        if batch:
+            model.objects.bulk_update(
+                batch, ['phone_normalized'], batch_size=BATCH_SIZE
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0016_task_completion_notes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='phone_normalized',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Phone with separators stripped, kept in sync on save', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='phone_normalized',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Phone with separators stripped, kept in sync on save', max_length=20),
+        ),
+        migrations.RunPython(backfill_phone_normalized, migrations.RunPython.noop),
+    ]
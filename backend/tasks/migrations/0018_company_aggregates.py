@@ -0,0 +1,73 @@
+# backend/tasks/migrations/0018_company_aggregates.py
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_company_aggregates(apps, schema_editor):
+    """Compute the aggregate columns for companies created before them.
+
+    Mirrors CompanyQuerySet.refresh_aggregates on the historical models:
+    one UPDATE with correlated subqueries covers the whole table.
+    """
+    Company = apps.get_model('tasks', 'Company')
+    Contact = apps.get_model('tasks', 'Contact')
+    Deal = apps.get_model('tasks', 'Deal')
+
+    def grouped(qs, expr):
+        return models.Subquery(
+            qs.order_by().values('company').annotate(agg=expr).values('agg')
+        )
+
+    contacts = Contact.objects.filter(
+        company=models.OuterRef('pk'), is_active=True
+    )
+    deals = Deal.objects.filter(
+        company=models.OuterRef('pk'), is_active=True
+    )
+    open_deals = deals.exclude(
+        stage__in=['closed_won', 'closed_lost']
+    )
+    Company.objects.update(
+        contact_count=Coalesce(grouped(contacts, models.Count('id')), 0),
+        deal_count=Coalesce(grouped(deals, models.Count('id')), 0),
+        active_deal_count=Coalesce(grouped(open_deals, models.Count('id')), 0),
+        total_deal_value=Coalesce(
+            grouped(deals, models.Sum('amount')),
+            models.Value(0),
+            output_field=models.DecimalField(max_digits=15, decimal_places=2),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0017_phone_normalized'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='contact_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='deal_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='active_deal_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='total_deal_value',
+            field=models.DecimalField(db_index=True, decimal_places=2, default=Decimal('0'), editable=False, max_digits=15),
+        ),
+        migrations.RunPython(backfill_company_aggregates, migrations.RunPython.noop),
+    ]
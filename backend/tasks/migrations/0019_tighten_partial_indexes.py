@@ -0,0 +1,51 @@
+# backend/tasks/migrations/0019_tighten_partial_indexes.py
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add is_active to the overdue-task and open-deal partial indexes.
+
+    Every view filters is_active=True before anything else, so rows of
+    soft-deleted tasks and deals in these indexes are dead weight: they
+    bloat the index and are always filtered back out. Narrowing the
+    predicates keeps the indexes to exactly the rows the hot queries
+    can match.
+    """
+
+    dependencies = [
+        ('tasks', '0018_company_aggregates'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_status_due_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                condition=models.Q(
+                    ('is_active', True),
+                    ('status__in', ['pending', 'in_progress']),
+                ),
+                fields=['status', 'due_date'],
+                name='task_status_due_idx',
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name='deal',
+            name='tasks_deal_open_stage_idx',
+        ),
+        migrations.AddIndex(
+            model_name='deal',
+            index=models.Index(
+                condition=(
+                    models.Q(('is_active', True))
+                    & ~models.Q(('stage__in', ['closed_won', 'closed_lost']))
+                ),
+                fields=['stage', 'expected_close_date'],
+                name='tasks_deal_open_stage_idx',
+            ),
+        ),
+    ]
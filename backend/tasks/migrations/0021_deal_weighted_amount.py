@@ -0,0 +1,30 @@
+# backend/tasks/migrations/0021_deal_weighted_amount.py
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0020_task_is_open'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='deal',
+            name='weighted_amount',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.ExpressionWrapper(
+                    models.F('amount') * models.F('probability')
+                    / models.Value(100.0),
+                    output_field=models.DecimalField(
+                        decimal_places=2, max_digits=15
+                    ),
+                ),
+                output_field=models.DecimalField(
+                    decimal_places=2, max_digits=15
+                ),
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# backend/tasks/migrations/0022_deal_code_no_truncate.py
+
+from django.db import migrations, models
+from django.db.models.functions import Cast, Concat, LPad
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0021_deal_weighted_amount'),
+    ]
+
+    operations = [
+        # Generated columns cannot be altered in place: drop and re-add
+        # with the new expression; the stored values regenerate
+        migrations.RemoveField(
+            model_name='deal',
+            name='deal_code',
+        ),
+        migrations.AddField(
+            model_name='deal',
+            name='deal_code',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=Concat(
+                    models.Value('DEAL-'),
+                    Cast('deal_year', output_field=models.CharField(max_length=4)),
+                    models.Value('-'),
+                    models.Case(
+                        models.When(
+                            deal_seq__lt=1000,
+                            then=LPad(
+                                Cast('deal_seq', output_field=models.CharField(max_length=10)),
+                                3,
+                                models.Value('0'),
+                            ),
+                        ),
+                        default=Cast('deal_seq', output_field=models.CharField(max_length=10)),
+                    ),
+                ),
+                help_text='Unique deal identifier (e.g., DEAL-2024-001)',
+                output_field=models.CharField(max_length=20),
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# backend/tasks/migrations/_operations.py
+#
+# Underscore-prefixed so the migration loader skips this module.
+
+from django.db.migrations.operations.models import AddIndex
+
+
+class AddIndexConcurrently(AddIndex):
+    """AddIndex that builds with CREATE INDEX CONCURRENTLY on PostgreSQL.
+
+    A plain CREATE INDEX holds a lock that blocks writes for the whole
+    build, which stalls the application when a migration runs against a
+    populated table. CONCURRENTLY cannot run inside a transaction, so any
+    migration using this operation must set ``atomic = False``. Other
+    backends fall back to the ordinary blocking build.
+    """
+
+    atomic = False
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection, model):
+            return
+        if schema_editor.connection.vendor == 'postgresql':
+            schema_editor.add_index(model, self.index, concurrently=True)
+        else:
+            schema_editor.add_index(model, self.index)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection, model):
+            return
+        if schema_editor.connection.vendor == 'postgresql':
+            schema_editor.remove_index(model, self.index, concurrently=True)
+        else:
+            schema_editor.remove_index(model, self.index)
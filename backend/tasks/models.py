@@ -1,24 +1,44 @@
 from django.db import models
+from django.db.models.functions import Cast, Concat, LPad
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator, URLValidator
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 import re
 
+from .managers import (
+    BulkManager, CompanyListManager, CompanyManager, ContactListManager,
+    ContactManager, DealListManager, DealManager, InteractionListManager,
+    InteractionManager, TaskListManager, TaskManager
+)
+from .utils import normalize_phone, uuid7
+
+# Compiled once at import: phone validation runs on every Company/Contact
+# save, so avoid the re cache lookup and intermediate strings per call.
+_PHONE_RE = re.compile(r'^\+?1?\d{9,15}$')
+
 
 class TimestampMixin(models.Model):
     """Abstract base model with common timestamp fields"""
     created_at = models.DateTimeField(auto_now_add=True, editable=False)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    # Validation lives at the form/serializer boundary; full_clean() in
+    # save() would re-run every validator plus unique-check SELECTs on
+    # each write, including internal updates. Tests that want the old
+    # belt-and-braces behavior can flip this on per class or instance.
+    VALIDATE_ON_SAVE = False
+
     class Meta:
         abstract = True
 
 
 class SoftDeleteMixin(models.Model):
     """Abstract base model for soft deletion support"""
-    is_active = models.BooleanField(default=True, db_index=True)
+    is_active = models.BooleanField(default=True)
     deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
     
     class Meta:
@@ -26,7 +46,6 @@ class SoftDeleteMixin(models.Model):
     
     def soft_delete(self):
         """Soft delete the instance"""
-        from django.utils import timezone
         self.is_active = False
         self.deleted_at = timezone.now()
         self.save(update_fields=['is_active', 'deleted_at'])
@@ -58,8 +77,9 @@ class Company(TimestampMixin, SoftDeleteMixin):
         ('large', 'Large (250+)'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    name = models.CharField(max_length=200, db_index=True)
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid7, editable=False, unique=True)
+    name = models.CharField(max_length=200)
     industry = models.CharField(
         max_length=50, 
         choices=INDUSTRY_CHOICES, 
@@ -78,21 +98,28 @@ class Company(TimestampMixin, SoftDeleteMixin):
         validators=[URLValidator(schemes=['http', 'https'])]
     )
     phone = models.CharField(
-        max_length=20, 
+        max_length=20,
         blank=True,
         help_text=_("Format: +1234567890")
     )
-    email = models.EmailField(blank=True, db_index=True)
+    phone_normalized = models.CharField(
+        max_length=20,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text=_("Phone with separators stripped, kept in sync on save")
+    )
+    email = models.EmailField(blank=True)
     address = models.TextField(blank=True)
     city = models.CharField(max_length=100, blank=True)
     state = models.CharField(max_length=100, blank=True)
     country = models.CharField(max_length=100, blank=True)
     postal_code = models.CharField(max_length=20, blank=True)
     notes = models.TextField(blank=True)
-    tags = models.CharField(
-        max_length=500, 
+    tags = models.JSONField(
+        default=list,
         blank=True,
-        help_text=_("Comma-separated tags for categorization")
+        help_text=_("List of tags for categorization")
     )
     annual_revenue = models.DecimalField(
         max_digits=15, 
@@ -121,13 +148,36 @@ class Company(TimestampMixin, SoftDeleteMixin):
         help_text=_("Primary account manager")
     )
 
+    # Denormalized aggregates maintained by the receivers in signals.py
+    # (refreshed on every contact/deal write); lists and dashboards read
+    # and sort these columns without joining the contact or deal tables
+    contact_count = models.PositiveIntegerField(default=0, editable=False)
+    deal_count = models.PositiveIntegerField(default=0, editable=False)
+    active_deal_count = models.PositiveIntegerField(default=0, editable=False)
+    total_deal_value = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal('0'),
+        editable=False,
+        db_index=True,
+    )
+
+    objects = CompanyManager()
+    list_objects = CompanyListManager()
+
     class Meta:
         ordering = ['-created_at', 'name']
         verbose_name_plural = 'Companies'
         indexes = [
-            models.Index(fields=['name', 'industry']),
-            models.Index(fields=['created_at']),
-            models.Index(fields=['email']),
+            models.Index(fields=['name', 'industry'],
+                         name='tasks_compa_name_9e0b98_idx'),
+            models.Index(fields=['email'], name='tasks_compa_email_ab67b8_idx'),
+            # Only live rows are listed by default, so index just those
+            models.Index(
+                fields=['created_at'],
+                name='tasks_comp_live_created_idx',
+                condition=models.Q(is_active=True, deleted_at__isnull=True)
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -144,46 +194,36 @@ class Company(TimestampMixin, SoftDeleteMixin):
         """Custom validation"""
         super().clean()
         
-        # Validate phone number format
+        # Validate the normalized phone number
+        self.phone_normalized = normalize_phone(self.phone)
         if self.phone and self.phone.strip():
-            phone_pattern = r'^\+?1?\d{9,15}$'
-            if not re.match(phone_pattern, self.phone.replace(' ', '').replace('-', '')):
+            if not _PHONE_RE.match(self.phone_normalized):
                 raise ValidationError({
                     'phone': _('Enter a valid phone number (e.g., +1234567890)')
                 })
-        
+
         # Validate website if provided
         if self.website and not self.website.startswith(('http://', 'https://')):
             self.website = f'https://{self.website}'
-    
+
     def save(self, *args, **kwargs):
-        self.full_clean()
+        self.phone_normalized = normalize_phone(self.phone)
+        if self.VALIDATE_ON_SAVE:
+            self.full_clean()
         super().save(*args, **kwargs)
     
-    @property
-    def contact_count(self):
-        """Return number of active contacts for this company"""
-        return self.contacts.filter(is_active=True).count()
-    
     @property
     def active_deals(self):
         """Return active deals (not won/lost)"""
-        from django.db.models import Q
+        # Served from the with_active_deals() prefetch when present
+        if hasattr(self, '_active_deals'):
+            return self._active_deals
         return self.deals.filter(
             is_active=True,
         ).exclude(
-            Q(stage='won') | Q(stage='lost')
-        )
-    
-    @property
-    def total_deal_value(self):
-        """Return total value of all active deals"""
-        return sum(
-            deal.amount for deal in self.deals.filter(is_active=True)
-            if deal.amount
+            stage__in=['closed_won', 'closed_lost']
         )
 
-
 class Contact(TimestampMixin, SoftDeleteMixin):
     """Contact model representing individual persons"""
     SALUTATION_CHOICES = [
@@ -203,7 +243,8 @@ class Contact(TimestampMixin, SoftDeleteMixin):
         ('other', 'Other'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid7, editable=False, unique=True)
     salutation = models.CharField(
         max_length=10, 
         choices=SALUTATION_CHOICES, 
@@ -211,14 +252,21 @@ class Contact(TimestampMixin, SoftDeleteMixin):
     )
     first_name = models.CharField(max_length=100, db_index=True)
     last_name = models.CharField(max_length=100, db_index=True)
-    email = models.EmailField(unique=True, db_index=True)
+    email = models.EmailField(unique=True)
     phone = models.CharField(
-        max_length=20, 
+        max_length=20,
         blank=True,
         help_text=_("Format: +1234567890")
     )
+    phone_normalized = models.CharField(
+        max_length=20,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text=_("Phone with separators stripped, kept in sync on save")
+    )
     mobile = models.CharField(
-        max_length=20, 
+        max_length=20,
         blank=True,
         help_text=_("Mobile phone number")
     )
@@ -240,10 +288,10 @@ class Contact(TimestampMixin, SoftDeleteMixin):
     is_decision_maker = models.BooleanField(default=False)
     date_of_birth = models.DateField(null=True, blank=True)
     notes = models.TextField(blank=True)
-    tags = models.CharField(
-        max_length=500, 
+    tags = models.JSONField(
+        default=list,
         blank=True,
-        help_text=_("Comma-separated tags for categorization")
+        help_text=_("List of tags for categorization")
     )
     social_linkedin = models.URLField(max_length=500, blank=True)
     social_twitter = models.URLField(max_length=500, blank=True)
@@ -262,13 +310,21 @@ class Contact(TimestampMixin, SoftDeleteMixin):
         help_text=_("Primary relationship manager")
     )
 
+    objects = ContactManager()
+    list_objects = ContactListManager()
+
     class Meta:
         ordering = ['-created_at', 'last_name', 'first_name']
         indexes = [
-            models.Index(fields=['last_name', 'first_name']),
-            models.Index(fields=['email']),
-            models.Index(fields=['company', 'position']),
-            models.Index(fields=['created_at']),
+            models.Index(fields=['last_name', 'first_name'],
+                         name='tasks_conta_last_na_9ee1c3_idx'),
+            models.Index(fields=['company', 'position'],
+                         name='tasks_conta_company_6c2d9e_idx'),
+            models.Index(
+                fields=['created_at'],
+                name='tasks_cont_live_created_idx',
+                condition=models.Q(is_active=True, deleted_at__isnull=True)
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -286,18 +342,20 @@ class Contact(TimestampMixin, SoftDeleteMixin):
         super().clean()
         
         # Validate phone numbers
+        self.phone_normalized = normalize_phone(self.phone)
         phone_fields = ['phone', 'mobile']
         for field_name in phone_fields:
             field_value = getattr(self, field_name, '')
             if field_value and field_value.strip():
-                phone_pattern = r'^\+?1?\d{9,15}$'
-                if not re.match(phone_pattern, field_value.replace(' ', '').replace('-', '')):
+                if not _PHONE_RE.match(normalize_phone(field_value)):
                     raise ValidationError({
                         field_name: _('Enter a valid phone number (e.g., +1234567890)')
                     })
-    
+
     def save(self, *args, **kwargs):
-        self.full_clean()
+        self.phone_normalized = normalize_phone(self.phone)
+        if self.VALIDATE_ON_SAVE:
+            self.full_clean()
         super().save(*args, **kwargs)
     
     @property
@@ -310,7 +368,6 @@ class Contact(TimestampMixin, SoftDeleteMixin):
     @property
     def age(self):
         """Calculate age from date of birth"""
-        from datetime import date
         if self.date_of_birth:
             today = date.today()
             return today.year - self.date_of_birth.year - (
@@ -321,13 +378,65 @@ class Contact(TimestampMixin, SoftDeleteMixin):
     @property
     def recent_interactions(self):
         """Get recent interactions with this contact"""
-        from .interaction import Interaction
+        # Querysets built via with_recent_interactions() prefetch the
+        # live interactions onto _recent; slice that instead of
+        # querying per contact
+        if hasattr(self, '_recent'):
+            return self._recent[:5]
         return Interaction.objects.filter(
             contact=self,
             is_active=True
         ).order_by('-interaction_date')[:5]
 
 
+# Validation-time lookups for Deal.clean, built once at import instead of
+# per call: the probability window per stage, and stage -> display label
+# (filled in after the class body defines STAGE_CHOICES).
+_STAGE_PROB = {
+    'lead': (0, 30),
+    'qualified': (30, 50),
+    'proposal': (50, 70),
+    'negotiation': (70, 90),
+    'closed_won': (95, 100),
+    'closed_lost': (0, 5),
+    'on_hold': (0, 100),
+}
+_STAGE_DISPLAY = {}
+
+# Hot-path membership checks; frozensets avoid allocating a throwaway
+# list on every property access in serializer loops.
+_CLOSED_STAGES = frozenset({'closed_won', 'closed_lost'})
+_TERMINAL_TASK_STATUSES = frozenset({'completed', 'cancelled'})
+
+
+class DealCodeCounter(models.Model):
+    """Per-year allocator for the sequence part of deal codes.
+
+    Fetching the next number is a single row UPDATE under row lock, so
+    concurrent deal inserts serialize on the counter instead of racing
+    an aggregate over the whole deal table (and colliding on the unique
+    (deal_year, deal_seq) constraint).
+    """
+    year = models.PositiveSmallIntegerField(primary_key=True)
+    last_seq = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.year}: {self.last_seq}"
+
+    @classmethod
+    def next_seq(cls, year):
+        """Atomically claim and return the next sequence number for a year."""
+        from django.db import transaction
+        with transaction.atomic():
+            cls.objects.get_or_create(year=year)
+            cls.objects.filter(year=year).update(
+                last_seq=models.F('last_seq') + 1
+            )
+            # Inside the same transaction this reads our own increment,
+            # even while a concurrent allocator blocks on the row lock.
+            return cls.objects.values_list('last_seq', flat=True).get(year=year)
+
+
 class Deal(TimestampMixin, SoftDeleteMixin):
     """Deal model representing sales opportunities"""
     STAGE_CHOICES = [
@@ -356,11 +465,32 @@ class Deal(TimestampMixin, SoftDeleteMixin):
         ('CAD', 'Canadian Dollar'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    deal_code = models.CharField(
-        max_length=50,
-        unique=True,
-        db_index=True,
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid7, editable=False, unique=True)
+    deal_year = models.PositiveSmallIntegerField(null=True, editable=False)
+    deal_seq = models.PositiveIntegerField(null=True, editable=False)
+    deal_code = models.GeneratedField(
+        # SQL LPAD truncates values wider than the pad width, so only
+        # sequences below 1000 get the zero padding; longer ones pass
+        # through whole (DEAL-2026-1000, not DEAL-2026-100)
+        expression=Concat(
+            models.Value('DEAL-'),
+            Cast('deal_year', output_field=models.CharField(max_length=4)),
+            models.Value('-'),
+            models.Case(
+                models.When(
+                    deal_seq__lt=1000,
+                    then=LPad(
+                        Cast('deal_seq', output_field=models.CharField(max_length=10)),
+                        3,
+                        models.Value('0')
+                    ),
+                ),
+                default=Cast('deal_seq', output_field=models.CharField(max_length=10)),
+            ),
+        ),
+        output_field=models.CharField(max_length=20),
+        db_persist=True,
         help_text=_("Unique deal identifier (e.g., DEAL-2024-001)")
     )
     title = models.CharField(max_length=200, db_index=True)
@@ -376,16 +506,26 @@ class Deal(TimestampMixin, SoftDeleteMixin):
     )
     stage = models.CharField(
         max_length=20, 
-        choices=STAGE_CHOICES, 
-        default='lead',
-        db_index=True
+        choices=STAGE_CHOICES,
+        default='lead'
     )
     probability = models.IntegerField(
         default=0,
         validators=[MinValueValidator(0), MaxValueValidator(100)],
         help_text=_('Win probability (0-100%)')
     )
-    expected_close_date = models.DateField(null=True, blank=True, db_index=True)
+    # Stored generated column: forecast and pipeline sums read the
+    # precomputed value instead of redoing amount * probability / 100
+    # per row per query
+    weighted_amount = models.GeneratedField(
+        expression=models.ExpressionWrapper(
+            models.F('amount') * models.F('probability') / models.Value(100.0),
+            output_field=models.DecimalField(max_digits=15, decimal_places=2),
+        ),
+        output_field=models.DecimalField(max_digits=15, decimal_places=2),
+        db_persist=True,
+    )
+    expected_close_date = models.DateField(null=True, blank=True)
     actual_close_date = models.DateField(null=True, blank=True)
     lost_reason = models.CharField(
         max_length=50, 
@@ -406,7 +546,7 @@ class Deal(TimestampMixin, SoftDeleteMixin):
         related_name='deals'
     )
     notes = models.TextField(blank=True)
-    tags = models.CharField(max_length=500, blank=True)
+    tags = models.JSONField(default=list, blank=True)
     
     # Team assignment
     created_by = models.ForeignKey(
@@ -424,6 +564,8 @@ class Deal(TimestampMixin, SoftDeleteMixin):
     )
     team_members = models.ManyToManyField(
         User,
+        through='DealTeamMember',
+        through_fields=('deal', 'user'),
         related_name='team_deals',
         blank=True,
         help_text=_("Additional team members working on this deal")
@@ -443,14 +585,55 @@ class Deal(TimestampMixin, SoftDeleteMixin):
         default='pipeline'
     )
 
+    objects = DealManager()
+    list_objects = DealListManager()
+
     class Meta:
         ordering = ['-created_at', '-expected_close_date']
         indexes = [
-            models.Index(fields=['deal_code']),
-            models.Index(fields=['stage', 'expected_close_date']),
-            models.Index(fields=['company', 'stage']),
-            models.Index(fields=['assigned_to', 'stage']),
-            models.Index(fields=['probability']),
+            models.Index(fields=['stage', 'expected_close_date'],
+                         name='tasks_deal_stage_8a6f1f_idx'),
+            models.Index(fields=['company', 'stage'],
+                         name='tasks_deal_company_7aa998_idx'),
+            models.Index(fields=['assigned_to', 'stage'],
+                         name='tasks_deal_assign_7a36d5_idx'),
+            models.Index(fields=['probability'], name='tasks_deal_probabi_31f7e6_idx'),
+            models.Index(
+                fields=['created_at'],
+                name='tasks_deal_live_created_idx',
+                condition=models.Q(is_active=True, deleted_at__isnull=True)
+            ),
+            models.Index(
+                fields=['stage', 'expected_close_date'],
+                name='tasks_deal_live_stage_idx',
+                condition=models.Q(is_active=True, deleted_at__isnull=True)
+            ),
+            # Pipeline/forecast queries only ever touch live open deals
+            models.Index(
+                fields=['stage', 'expected_close_date'],
+                name='tasks_deal_open_stage_idx',
+                condition=(
+                    models.Q(is_active=True)
+                    & ~models.Q(stage__in=['closed_won', 'closed_lost'])
+                )
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['deal_year', 'deal_seq'],
+                name='unique_deal_year_seq'
+            ),
+            models.CheckConstraint(
+                check=models.Q(probability__gte=0) & models.Q(probability__lte=100),
+                name='deal_probability_range'
+            ),
+            models.CheckConstraint(
+                check=(
+                    models.Q(stage__in=['closed_won', 'closed_lost'])
+                    & models.Q(actual_close_date__isnull=False)
+                ) | ~models.Q(stage__in=['closed_won', 'closed_lost']),
+                name='deal_closed_has_date'
+            ),
         ]
 
     def __str__(self):
@@ -459,24 +642,14 @@ class Deal(TimestampMixin, SoftDeleteMixin):
     def clean(self):
         """Custom validation"""
         super().clean()
-        
+
         # Validate probability based on stage
-        stage_probability_map = {
-            'lead': (0, 30),
-            'qualified': (30, 50),
-            'proposal': (50, 70),
-            'negotiation': (70, 90),
-            'closed_won': (95, 100),
-            'closed_lost': (0, 5),
-            'on_hold': (0, 100),
-        }
-        
-        if self.stage in stage_probability_map:
-            min_prob, max_prob = stage_probability_map[self.stage]
+        if self.stage in _STAGE_PROB:
+            min_prob, max_prob = _STAGE_PROB[self.stage]
             if not (min_prob <= self.probability <= max_prob):
                 raise ValidationError({
                     'probability': _(
-                        f'Probability should be between {min_prob}-{max_prob}% for {self.get_stage_display()} stage'
+                        f'Probability should be between {min_prob}-{max_prob}% for {_STAGE_DISPLAY[self.stage]} stage'
                     )
                 })
         
@@ -488,56 +661,47 @@ class Deal(TimestampMixin, SoftDeleteMixin):
                 })
     
     def save(self, *args, **kwargs):
-        # Auto-generate deal code if not provided
-        if not self.deal_code:
-            from django.db.models import Max
-            last_deal = Deal.objects.filter(
-                deal_code__regex=r'^DEAL-\d{4}-\d{3}$'
-            ).aggregate(Max('deal_code'))
-            
-            if last_deal['deal_code__max']:
-                last_num = int(last_deal['deal_code__max'].split('-')[-1])
-                new_num = last_num + 1
-            else:
-                new_num = 1
-            
-            from datetime import datetime
-            year = datetime.now().year
-            self.deal_code = f"DEAL-{year}-{new_num:03d}"
-        
-        self.full_clean()
+        # Allocate the next (year, sequence) pair; deal_code is generated
+        # from it by the database
+        if self.deal_year is None or self.deal_seq is None:
+            self.deal_year = datetime.now().year
+            self.deal_seq = DealCodeCounter.next_seq(self.deal_year)
+
+        if self.VALIDATE_ON_SAVE:
+            self.full_clean()
         super().save(*args, **kwargs)
     
-    @property
-    def weighted_amount(self):
-        """Calculate weighted deal amount (amount * probability)"""
-        return (self.amount * self.probability) / 100
-    
     @property
     def days_in_stage(self):
         """Calculate days in current stage"""
-        from django.utils import timezone
-        from .deal_stage_history import DealStageHistory
-        
-        latest_history = DealStageHistory.objects.filter(
-            deal=self
-        ).order_by('-changed_at').first()
-        
-        if latest_history:
-            days = (timezone.now().date() - latest_history.changed_at.date()).days
+
+        # Querysets built via with_days_in_stage() carry the latest
+        # change as an annotation; the per-deal query is the fallback.
+        # The annotation is trusted even when None (no history yet), so
+        # annotated querysets never fall back to per-row queries.
+        try:
+            last_change = self._last_stage_change
+        except AttributeError:
+            last_change = DealStageHistory.objects.filter(
+                deal=self
+            ).order_by('-changed_at').values_list(
+                'changed_at', flat=True
+            ).first()
+
+        if last_change:
+            days = (timezone.now().date() - last_change.date()).days
             return max(0, days)
         return 0
     
     @property
     def is_closed(self):
         """Check if deal is closed (won or lost)"""
-        return self.stage in ['closed_won', 'closed_lost']
+        return self.stage in _CLOSED_STAGES
     
     def close_deal(self, stage, lost_reason='', lost_notes=''):
         """Helper method to close a deal"""
-        from django.utils import timezone
         
-        if stage not in ['closed_won', 'closed_lost']:
+        if stage not in _CLOSED_STAGES:
             raise ValidationError(_("Stage must be 'closed_won' or 'closed_lost'"))
         
         self.stage = stage
@@ -551,6 +715,92 @@ class Deal(TimestampMixin, SoftDeleteMixin):
         self.save()
 
 
+_STAGE_DISPLAY.update(Deal.STAGE_CHOICES)
+
+
+class DealTeamMember(models.Model):
+    """Explicit through model for Deal.team_members.
+
+    Carries membership metadata (role, when and by whom the member was
+    added) and gives prefetches a concrete queryset to select_related
+    against, instead of the bare auto-generated join table.
+    """
+    id = models.BigAutoField(primary_key=True)
+    deal = models.ForeignKey(
+        Deal,
+        on_delete=models.CASCADE,
+        related_name='memberships'
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='deal_memberships'
+    )
+    role = models.CharField(max_length=50, blank=True)
+    added_at = models.DateTimeField(auto_now_add=True)
+    added_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'deal'],
+                         name='tasks_dealt_user_id_4f10cc_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['deal', 'user'],
+                name='unique_deal_team_member'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user} on {self.deal}"
+
+
+class Attachment(TimestampMixin):
+    """Content-addressed file storage keyed by SHA-256.
+
+    The same collateral (spec PDFs, contract templates) gets attached to
+    many tasks; storing one copy per distinct content hash keeps storage
+    and backups at O(distinct files) and lets identical re-uploads
+    short-circuit after the hash.
+    """
+    hash = models.CharField(
+        max_length=64,
+        primary_key=True,
+        help_text=_("SHA-256 hex digest of the file contents")
+    )
+    file = models.FileField(upload_to='attachments/')
+    size = models.BigIntegerField()
+    content_type = models.CharField(max_length=100, blank=True)
+
+    def __str__(self):
+        return f"{self.file.name} ({self.hash[:12]})"
+
+    @classmethod
+    def from_uploaded_file(cls, uploaded_file):
+        """Hash the upload and reuse an existing row for identical content."""
+        import hashlib
+        digest = hashlib.sha256()
+        for chunk in uploaded_file.chunks():
+            digest.update(chunk)
+        uploaded_file.seek(0)
+        attachment, _created = cls.objects.get_or_create(
+            hash=digest.hexdigest(),
+            defaults={
+                'file': uploaded_file,
+                'size': uploaded_file.size,
+                'content_type': getattr(uploaded_file, 'content_type', '') or '',
+            }
+        )
+        return attachment
+
+
 class Task(TimestampMixin, SoftDeleteMixin):
     """Task model for tracking activities and to-dos"""
     STATUS_CHOICES = [
@@ -577,7 +827,8 @@ class Task(TimestampMixin, SoftDeleteMixin):
         ('other', 'Other'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid7, editable=False, unique=True)
     title = models.CharField(max_length=200, db_index=True)
     description = models.TextField(blank=True)
     task_type = models.CharField(
@@ -587,10 +838,21 @@ class Task(TimestampMixin, SoftDeleteMixin):
         db_index=True
     )
     status = models.CharField(
-        max_length=20, 
-        choices=STATUS_CHOICES, 
-        default='pending',
-        db_index=True
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='pending'
+    )
+    # Stored generated column precomputing the open-status test the
+    # overdue filters run, so they read one boolean instead of
+    # re-evaluating status IN (...) per row. Overdue itself has to stay
+    # query-time: it depends on now(), which is not immutable.
+    is_open = models.GeneratedField(
+        expression=models.ExpressionWrapper(
+            models.Q(status__in=['pending', 'in_progress']),
+            output_field=models.BooleanField(),
+        ),
+        output_field=models.BooleanField(),
+        db_persist=True,
     )
     priority = models.CharField(
         max_length=10, 
@@ -600,6 +862,10 @@ class Task(TimestampMixin, SoftDeleteMixin):
     )
     due_date = models.DateTimeField(null=True, blank=True, db_index=True)
     completed_date = models.DateTimeField(null=True, blank=True)
+    completion_notes = models.TextField(
+        blank=True,
+        help_text=_("Notes recorded when the task was completed")
+    )
     estimated_hours = models.DecimalField(
         max_digits=5, 
         decimal_places=2, 
@@ -617,22 +883,22 @@ class Task(TimestampMixin, SoftDeleteMixin):
     
     # Relationships
     contact = models.ForeignKey(
-        Contact, 
-        on_delete=models.CASCADE, 
-        null=True, 
-        blank=True, 
+        Contact,
+        on_delete=models.DO_NOTHING,
+        null=True,
+        blank=True,
         related_name='tasks'
     )
     deal = models.ForeignKey(
-        Deal, 
-        on_delete=models.CASCADE, 
-        null=True, 
-        blank=True, 
+        Deal,
+        on_delete=models.DO_NOTHING,
+        null=True,
+        blank=True,
         related_name='tasks'
     )
     company = models.ForeignKey(
         Company,
-        on_delete=models.CASCADE,
+        on_delete=models.DO_NOTHING,
         null=True,
         blank=True,
         related_name='tasks'
@@ -655,32 +921,74 @@ class Task(TimestampMixin, SoftDeleteMixin):
     
     # Task metadata
     recurrence_pattern = models.CharField(
-        max_length=100, 
+        max_length=100,
         blank=True,
         help_text=_("Cron-like pattern for recurring tasks")
     )
+    next_occurrence = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text=_("Next run precomputed from recurrence_pattern at save time")
+    )
     parent_task = models.ForeignKey(
         'self',
-        on_delete=models.CASCADE,
+        on_delete=models.DO_NOTHING,
         null=True,
         blank=True,
         related_name='subtasks'
     )
-    tags = models.CharField(max_length=500, blank=True)
-    attachment = models.FileField(
-        upload_to='task_attachments/',
+    tags = models.JSONField(default=list, blank=True)
+    attachment = models.ForeignKey(
+        'Attachment',
+        on_delete=models.PROTECT,
         null=True,
         blank=True,
-        help_text=_("Related file attachment")
+        related_name='tasks',
+        help_text=_("Related file attachment (deduplicated by content hash)")
     )
 
+    objects = TaskManager()
+    list_objects = TaskListManager()
+
     class Meta:
         ordering = ['priority', 'due_date', '-created_at']
         indexes = [
-            models.Index(fields=['due_date', 'priority']),
-            models.Index(fields=['assigned_to', 'status']),
-            models.Index(fields=['contact', 'deal', 'company']),
-            models.Index(fields=['status', 'completed_date']),
+            models.Index(fields=['due_date', 'priority'],
+                         name='tasks_task_due_dat_d2a147_idx'),
+            models.Index(fields=['assigned_to', 'status'],
+                         name='tasks_task_assign_37c921_idx'),
+            models.Index(fields=['contact', 'deal', 'company'],
+                         name='tasks_task_contact_8c5d97_idx'),
+            models.Index(fields=['status', 'completed_date'],
+                         name='tasks_task_status_226677_idx'),
+            # Partial index covering the overdue filter: only live
+            # pending or in-progress rows are ever matched against
+            # due_date, so index exactly those
+            models.Index(
+                fields=['status', 'due_date'],
+                name='task_status_due_idx',
+                condition=models.Q(
+                    is_active=True, status__in=['pending', 'in_progress']
+                )
+            ),
+            models.Index(
+                fields=['created_at'],
+                name='tasks_task_live_created_idx',
+                condition=models.Q(is_active=True, deleted_at__isnull=True)
+            ),
+        ]
+        constraints = [
+            # Single-Q form so the deconstruction matches what 0009
+            # recorded; two ANDed Qs would read as a different
+            # constraint and makemigrations would want a drop/re-add
+            models.CheckConstraint(
+                check=models.Q(
+                    status='completed', completed_date__isnull=False
+                ) | ~models.Q(status='completed'),
+                name='task_completed_has_date'
+            ),
         ]
         permissions = [
             ('can_reassign_task', 'Can reassign tasks to other users'),
@@ -696,7 +1004,6 @@ class Task(TimestampMixin, SoftDeleteMixin):
         super().clean()
         
         # Validate due date
-        from django.utils import timezone
         if self.due_date and self.due_date < timezone.now():
             if self.status != 'completed':
                 raise ValidationError({
@@ -716,35 +1023,66 @@ class Task(TimestampMixin, SoftDeleteMixin):
     
     def save(self, *args, **kwargs):
         # Set completed_date if status changes to completed
-        from django.utils import timezone
         if self.status == 'completed' and not self.completed_date:
             self.completed_date = timezone.now()
         elif self.status != 'completed' and self.completed_date:
             self.completed_date = None
-        
-        self.full_clean()
+
+        # Parse the recurrence pattern once at write time so schedulers can
+        # run an indexed next_occurrence range query instead of re-parsing
+        # every pattern on every tick
+        self.next_occurrence = self._compute_next_occurrence()
+
+        if self.VALIDATE_ON_SAVE:
+            self.full_clean()
         super().save(*args, **kwargs)
+
+    def _compute_next_occurrence(self):
+        """Next run derived from recurrence_pattern.
+
+        Supports the simple intervals used in the UI ('daily', 'weekly',
+        'monthly') counted from due_date or now. Unknown patterns yield
+        None rather than guessing.
+        """
+        if not self.recurrence_pattern or self.status in _TERMINAL_TASK_STATUSES:
+            return None
+        deltas = {
+            'daily': timedelta(days=1),
+            'weekly': timedelta(weeks=1),
+            'monthly': timedelta(days=30),
+        }
+        delta = deltas.get(self.recurrence_pattern.strip().lower())
+        if delta is None:
+            return None
+        base = self.due_date or timezone.now()
+        return base + delta
     
     @property
     def is_overdue(self):
         """Check if task is overdue"""
-        from django.utils import timezone
-        if self.due_date and self.status not in ['completed', 'cancelled']:
+        if self.due_date and self.status not in _TERMINAL_TASK_STATUSES:
             return self.due_date < timezone.now()
         return False
     
     @property
     def days_overdue(self):
         """Calculate days overdue"""
-        from django.utils import timezone
+        # Querysets built via with_metrics() carry the overdue age as a
+        # duration annotation
+        overdue_for = getattr(self, 'overdue_for_db', None)
+        if overdue_for is not None:
+            return max(0, overdue_for.days)
         if self.is_overdue:
             days = (timezone.now() - self.due_date).days
             return max(0, days)
         return 0
-    
+
     @property
     def completion_rate(self):
         """Calculate completion rate based on actual vs estimated hours"""
+        rate = getattr(self, 'completion_rate_db', None)
+        if rate is not None:
+            return rate
         if self.estimated_hours and self.actual_hours:
             if self.estimated_hours > 0:
                 return (self.actual_hours / self.estimated_hours) * 100
@@ -763,7 +1101,6 @@ class Task(TimestampMixin, SoftDeleteMixin):
     
     def complete_task(self, actual_hours=None, notes=''):
         """Helper method to complete a task"""
-        from django.utils import timezone
         
         self.status = 'completed'
         self.completed_date = timezone.now()
@@ -771,17 +1108,32 @@ class Task(TimestampMixin, SoftDeleteMixin):
         if actual_hours is not None:
             self.actual_hours = actual_hours
         
-        if notes and not self.description.endswith(f"\n\nCompletion Notes: {notes}"):
-            self.description += f"\n\nCompletion Notes: {notes}"
-        
+        # Dedicated column instead of appending to description, which
+        # re-scanned the whole text per completion and grew unboundedly
+        if notes:
+            self.completion_notes = notes
+
         self.save()
     
     def get_subtasks(self):
-        """Get all subtasks recursively"""
-        subtasks = list(self.subtasks.all())
-        for subtask in subtasks:
-            subtasks.extend(subtask.get_subtasks())
-        return subtasks
+        """Get all subtasks recursively.
+
+        The whole subtree is resolved in one recursive CTE instead of
+        one query per node, so the cost no longer grows with tree size
+        (sqlite and PostgreSQL both support WITH RECURSIVE).
+        """
+        from django.db import connection
+        sql = (
+            'WITH RECURSIVE st(id) AS ('
+            '    SELECT id FROM tasks_task WHERE parent_task_id = %s'
+            '    UNION ALL'
+            '    SELECT t.id FROM tasks_task t JOIN st ON t.parent_task_id = st.id'
+            ') SELECT id FROM st'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [self.pk])
+            ids = [row[0] for row in cursor.fetchall()]
+        return list(Task.objects.filter(id__in=ids))
 
 
 # New supporting models for enhanced functionality
@@ -797,31 +1149,34 @@ class Interaction(TimestampMixin, SoftDeleteMixin):
         ('proposal', 'Proposal Sent'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid7, editable=False, unique=True)
     interaction_type = models.CharField(max_length=20, choices=INTERACTION_TYPES)
     subject = models.CharField(max_length=200)
     description = models.TextField()
-    interaction_date = models.DateTimeField(db_index=True)
+    # Covered by the (interaction_date, interaction_type) composite for
+    # equality/range seeks and by the BRIN index for analytical scans
+    interaction_date = models.DateTimeField()
     duration_minutes = models.PositiveIntegerField(null=True, blank=True)
     
     # Relationships
     contact = models.ForeignKey(
-        Contact, 
-        on_delete=models.CASCADE, 
-        null=True, 
-        blank=True, 
+        Contact,
+        on_delete=models.DO_NOTHING,
+        null=True,
+        blank=True,
         related_name='interactions'
     )
     company = models.ForeignKey(
         Company,
-        on_delete=models.CASCADE,
+        on_delete=models.DO_NOTHING,
         null=True,
         blank=True,
         related_name='interactions'
     )
     deal = models.ForeignKey(
         Deal,
-        on_delete=models.CASCADE,
+        on_delete=models.DO_NOTHING,
         null=True,
         blank=True,
         related_name='interactions'
@@ -839,24 +1194,44 @@ class Interaction(TimestampMixin, SoftDeleteMixin):
     follow_up_date = models.DateTimeField(null=True, blank=True)
     follow_up_notes = models.TextField(blank=True)
     
+    objects = InteractionManager()
+    list_objects = InteractionListManager()
+
     class Meta:
         ordering = ['-interaction_date']
         indexes = [
-            models.Index(fields=['interaction_date', 'interaction_type']),
-            models.Index(fields=['contact', 'company', 'deal']),
+            models.Index(fields=['interaction_date', 'interaction_type'],
+                         name='tasks_inter_interac_33f012_idx'),
+            models.Index(fields=['contact', 'company', 'deal'],
+                         name='tasks_inter_contact_4a4496_idx'),
+            models.Index(
+                fields=['created_at'],
+                name='tasks_inter_live_created_idx',
+                condition=models.Q(is_active=True, deleted_at__isnull=True)
+            ),
+            # Matches Contact.recent_interactions: live rows for one
+            # contact, newest first
+            models.Index(
+                fields=['contact', '-interaction_date'],
+                name='tasks_inter_cont_recent_idx',
+                condition=models.Q(is_active=True)
+            ),
         ]
 
 
 class DealStageHistory(TimestampMixin):
     """Track history of deal stage changes"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    deal = models.ForeignKey(Deal, on_delete=models.CASCADE, related_name='stage_history')
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid7, editable=False, unique=True)
+    deal = models.ForeignKey(Deal, on_delete=models.DO_NOTHING, related_name='stage_history')
     from_stage = models.CharField(max_length=20, choices=Deal.STAGE_CHOICES)
     to_stage = models.CharField(max_length=20, choices=Deal.STAGE_CHOICES)
     changed_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     changed_at = models.DateTimeField(auto_now_add=True)
     notes = models.TextField(blank=True)
-    
+
+    objects = BulkManager()
+
     class Meta:
         ordering = ['-changed_at']
         verbose_name_plural = 'Deal Stage Histories'
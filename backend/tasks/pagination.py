@@ -0,0 +1,25 @@
+# backend/tasks/pagination.py
+
+"""Cursor pagination for the list endpoints.
+
+PageNumberPagination runs a COUNT(*) over the filtered set plus an
+OFFSET scan on every page, and both grow with table size — deep pages
+walk and discard every earlier row. Cursor pages instead filter on the
+ordering columns (WHERE created_at < :cursor), an index range scan
+whose cost does not depend on page depth, and skip the count entirely.
+Callers that need totals use the /count/ action instead of reading
+them off every page.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class CRMCursorPagination(CursorPagination):
+    """Cursor pages ordered by each viewset's own default ordering.
+
+    The ordering filter backend supplies the cursor ordering, so deals
+    keep paging by -expected_close_date and tasks by priority/due_date;
+    -created_at here is only the fallback. Page size comes from the
+    REST_FRAMEWORK PAGE_SIZE setting, as before.
+    """
+    ordering = '-created_at'
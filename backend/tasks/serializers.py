@@ -1,30 +1,288 @@
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
+from rest_framework.validators import UniqueTogetherValidator
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils import timezone
 from .models import (
-    Company, Contact, Deal, Task, 
-    Interaction, DealStageHistory, NotificationPreference
+    Attachment, Company, Contact, Deal, Task,
+    Interaction, DealStageHistory, NotificationPreference,
+    _TERMINAL_TASK_STATUSES,
 )
-import uuid
+import copy
+import re
+
+from .utils import normalize_phone
+
+# Compiled once at import; validate() runs on every write request.
+_PHONE_RE = re.compile(r'^\+?1?\d{9,15}$')
+
+
+def _choice_map(model, field_name):
+    """Materialize a field's choices as a plain dict, labels resolved once."""
+    return {
+        value: str(label)
+        for value, label in model._meta.get_field(field_name).choices
+    }
+
+
+# Display labels resolved at import; get_FOO_display() re-runs a dict
+# build plus force_str per call, which adds up across list rows.
+_INDUSTRY_DISPLAY = _choice_map(Company, 'industry')
+_COMPANY_SIZE_DISPLAY = _choice_map(Company, 'company_size')
+_SALUTATION_DISPLAY = _choice_map(Contact, 'salutation')
+_SOURCE_DISPLAY = _choice_map(Contact, 'source')
+_STAGE_DISPLAY = _choice_map(Deal, 'stage')
+_CURRENCY_DISPLAY = _choice_map(Deal, 'currency')
+_LOST_REASON_DISPLAY = _choice_map(Deal, 'lost_reason')
+_FORECAST_CATEGORY_DISPLAY = _choice_map(Deal, 'forecast_category')
+_TASK_TYPE_DISPLAY = _choice_map(Task, 'task_type')
+_TASK_STATUS_DISPLAY = _choice_map(Task, 'status')
+_TASK_PRIORITY_DISPLAY = _choice_map(Task, 'priority')
+_INTERACTION_TYPE_DISPLAY = _choice_map(Interaction, 'interaction_type')
+
+
+# Sentinel distinguishing "field absent from the payload" from a
+# legitimate None/blank value in validate() bodies.
+_MISSING = object()
+
+
+# Allowed probability bounds per stage, allocated once; DealSerializer
+# rebuilt this dict on every validation call.
+_STAGE_PROB_BOUNDS = {
+    'lead': (0, 30),
+    'qualified': (30, 50),
+    'proposal': (50, 70),
+    'negotiation': (70, 90),
+    'closed_won': (95, 100),
+    'closed_lost': (0, 5),
+    'on_hold': (0, 100),
+}
+
+
+class ChoiceDisplayField(serializers.ReadOnlyField):
+    """Choice label rendering as a single dict lookup per row.
+
+    Unknown or blank values fall through unchanged, matching what
+    get_FOO_display() returns for them.
+    """
+
+    def __init__(self, mapping, **kwargs):
+        self.mapping = mapping
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return self.mapping.get(value, value)
+
+
+class MoneyField(serializers.ReadOnlyField):
+    """Two-place money rendering as a single format call per row.
+
+    The computed amounts (annotations and properties) arrive as Decimal
+    already constrained to two places, so DecimalField's per-row
+    quantize/validation walk only re-derives the same string. Write
+    paths keep DecimalField; this is for read-only output.
+    """
+
+    def to_representation(self, value):
+        if value is None:
+            return None
+        return f"{value:.2f}"
+
+
+class CheapPKField(serializers.PrimaryKeyRelatedField):
+    """PrimaryKeyRelatedField with one lookup per (model, pk) per request.
+
+    Writes that reference the same row through several fields (e.g.
+    created_by_id and assigned_to_id both set to the current user) or
+    bulk payloads repeating a company/deal each paid a full SELECT per
+    field. Resolved rows are memoized on the request so every repeat is
+    a dict hit. The row is still fetched in full on the first hit: the
+    serializers echo the related object back in the response, so a
+    pk-only stub would render with blank attributes.
+    """
+
+    def to_internal_value(self, data):
+        request = self.context.get('request')
+        if request is None:
+            return super().to_internal_value(data)
+        cache = getattr(request, '_resolved_fk_cache', None)
+        if cache is None:
+            cache = request._resolved_fk_cache = {}
+        key = (self.get_queryset().model, str(data))
+        if key not in cache:
+            cache[key] = super().to_internal_value(data)
+        return cache[key]
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        # many=True resolves the whole pk list in one query instead of
+        # one SELECT per item
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BatchedManyRelatedField(**list_kwargs)
+
+
+class BatchedManyRelatedField(serializers.ManyRelatedField):
+    """Many-pk resolution as one IN (...) query for the whole list.
+
+    The stock ManyRelatedField resolves each pk through the child field,
+    i.e. one SELECT per list item. This fetches the batch in a single
+    filter and reports missing or malformed pks with the child field's
+    own error messages.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+        data = list(data)
+        queryset = self.child_relation.get_queryset()
+        try:
+            rows = {str(obj.pk): obj for obj in queryset.filter(pk__in=data)}
+        except (TypeError, ValueError, DjangoValidationError):
+            # Unfilterable pk in the list; re-run per item so the child
+            # field raises its usual incorrect_type error for it.
+            return [self.child_relation.to_internal_value(item) for item in data]
+        out = []
+        for item in data:
+            obj = rows.get(str(item))
+            if obj is None:
+                self.child_relation.fail('does_not_exist', pk_value=item)
+            out.append(obj)
+        return out
+
+
+class ConditionalUniqueTogetherValidator(UniqueTogetherValidator):
+    """Unique-together check that skips when any of its fields is null.
+
+    Mirrors a conditional UniqueConstraint (e.g. unique (email, company)
+    only where company is not null): rows with the optional column empty
+    are exempt, so the validator must not force the field to required
+    the way the stock UniqueTogetherValidator does.
+    """
+
+    def enforce_required_fields(self, attrs, serializer):
+        pass
+
+    def __call__(self, attrs, serializer):
+        sources = [serializer.fields[name].source for name in self.fields]
+        values = dict(attrs)
+        if serializer.instance is not None:
+            for source in sources:
+                if source not in values:
+                    values[source] = getattr(serializer.instance, source)
+        if any(values.get(source) in (None, '') for source in sources):
+            return
+        super().__call__(attrs, serializer)
+
+
+class CachedFieldsMixin:
+    """Cache the field map `get_fields()` builds, per serializer class.
+
+    `get_fields()` re-walks the model meta, rebuilds every declared field
+    and re-collects validators on every serializer instantiation. The
+    result only depends on the class, so we build it once and hand each
+    instance shallow copies (binding mutates the field, so the cached
+    templates must never be bound themselves).
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses add or override fields; never inherit a parent cache.
+        cls._fields_cache = None
+
+    def get_fields(self):
+        cls = type(self)
+        cache = cls.__dict__.get('_fields_cache')
+        if cache is None:
+            cache = super().get_fields()
+            cls._fields_cache = cache
+        return {name: copy.copy(field) for name, field in cache.items()}
+
+
+def _memo_per_request(to_representation):
+    """Memoize a field's row rendering on the serializer context.
+
+    The same related row (a user who authored the page, a shared parent
+    task) appears on many list rows, and each appearance rebuilt the
+    same output dict. The context lives for one serializer instance —
+    i.e. one request — so caching there turns O(rows) dict builds into
+    O(unique related rows).
+    """
+    key_prefix = to_representation.__qualname__
+
+    def wrapper(self, obj):
+        cache = self.context.setdefault('_memo', {})
+        key = (key_prefix, obj.pk)
+        if key not in cache:
+            cache[key] = to_representation(self, obj)
+        return cache[key]
+    return wrapper
 
 
 # Helper serializers
+class UserFullNameField(serializers.ReadOnlyField):
+    """Full name with username fallback, without method-field dispatch.
+
+    SerializerMethodField costs a getattr plus a bound-method call per
+    row; this field reads the user directly. User has no full_name
+    property to point a ReadOnlyField at, hence the small subclass.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['source'] = '*'
+        super().__init__(**kwargs)
+
+    def to_representation(self, user):
+        if user.first_name or user.last_name:
+            return f"{user.first_name} {user.last_name}"
+        return user.username
+
+
 class UserSimpleSerializer(serializers.ModelSerializer):
     """Simple user serializer for nested relationships"""
-    full_name = serializers.SerializerMethodField()
-    
+    full_name = UserFullNameField()
+
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'full_name']
         read_only_fields = fields
-    
-    def get_full_name(self, obj):
-        return f"{obj.first_name} {obj.last_name}" if obj.first_name or obj.last_name else obj.username
+
+
+class UserSimpleField(serializers.ReadOnlyField):
+    """Nested user rendering without serializer machinery.
+
+    Same output shape as UserSimpleSerializer, built as one plain dict
+    per row instead of walking six bound fields. The user row arrives
+    pre-joined through the managers' select_related, so no query is
+    issued here.
+    """
+
+    @_memo_per_request
+    def to_representation(self, user):
+        if user.first_name or user.last_name:
+            full_name = f"{user.first_name} {user.last_name}"
+        else:
+            full_name = user.username
+        return {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'full_name': full_name,
+        }
 
 
 class CompanyNestedSerializer(serializers.ModelSerializer):
     """Nested company serializer for use in other serializers"""
-    industry_display = serializers.CharField(source='get_industry_display', read_only=True)
-    company_size_display = serializers.CharField(source='get_company_size_display', read_only=True)
+    id = serializers.UUIDField(source='public_id', read_only=True)
+    industry_display = ChoiceDisplayField(_INDUSTRY_DISPLAY, source='industry')
+    company_size_display = ChoiceDisplayField(_COMPANY_SIZE_DISPLAY, source='company_size')
     
     class Meta:
         model = Company
@@ -35,23 +293,22 @@ class CompanyNestedSerializer(serializers.ModelSerializer):
 
 class ContactNestedSerializer(serializers.ModelSerializer):
     """Nested contact serializer for use in other serializers"""
-    full_name = serializers.SerializerMethodField()
-    salutation_display = serializers.CharField(source='get_salutation_display', read_only=True)
-    
+    id = serializers.UUIDField(source='public_id', read_only=True)
+    full_name = serializers.ReadOnlyField()
+    salutation_display = ChoiceDisplayField(_SALUTATION_DISPLAY, source='salutation')
+
     class Meta:
         model = Contact
-        fields = ['id', 'full_name', 'first_name', 'last_name', 'salutation', 
+        fields = ['id', 'full_name', 'first_name', 'last_name', 'salutation',
                  'salutation_display', 'email', 'phone', 'position', 'company']
         read_only_fields = fields
-    
-    def get_full_name(self, obj):
-        return obj.full_name
 
 
 class DealNestedSerializer(serializers.ModelSerializer):
     """Nested deal serializer for use in other serializers"""
-    stage_display = serializers.CharField(source='get_stage_display', read_only=True)
-    currency_display = serializers.CharField(source='get_currency_display', read_only=True)
+    id = serializers.UUIDField(source='public_id', read_only=True)
+    stage_display = ChoiceDisplayField(_STAGE_DISPLAY, source='stage')
+    currency_display = ChoiceDisplayField(_CURRENCY_DISPLAY, source='currency')
     
     class Meta:
         model = Deal
@@ -61,25 +318,27 @@ class DealNestedSerializer(serializers.ModelSerializer):
 
 
 # Main serializers
-class CompanySerializer(serializers.ModelSerializer):
+class CompanySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Main company serializer with full details"""
-    id = serializers.UUIDField(read_only=True, default=uuid.uuid4)
-    industry_display = serializers.CharField(source='get_industry_display', read_only=True)
-    company_size_display = serializers.CharField(source='get_company_size_display', read_only=True)
-    created_by = UserSimpleSerializer(read_only=True)
-    assigned_to = UserSimpleSerializer(read_only=True)
+    id = serializers.UUIDField(source='public_id', read_only=True)
+    industry_display = ChoiceDisplayField(_INDUSTRY_DISPLAY, source='industry')
+    company_size_display = ChoiceDisplayField(_COMPANY_SIZE_DISPLAY, source='company_size')
+    created_by = UserSimpleField()
+    assigned_to = UserSimpleField()
     contact_count = serializers.IntegerField(read_only=True)
-    active_deals = DealNestedSerializer(many=True, read_only=True, source='deals.filter(is_active=True)')
-    total_deal_value = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True)
+    # Reads the active_deals property, which serves the batched
+    # with_active_deals() prefetch when the view queryset applied it
+    active_deals = DealNestedSerializer(many=True, read_only=True)
+    total_deal_value = MoneyField()
     
     # For write operations
-    created_by_id = serializers.PrimaryKeyRelatedField(
+    created_by_id = CheapPKField(
         queryset=User.objects.all(),
         write_only=True,
         source='created_by',
         required=False
     )
-    assigned_to_id = serializers.PrimaryKeyRelatedField(
+    assigned_to_id = CheapPKField(
         queryset=User.objects.all(),
         write_only=True,
         source='assigned_to',
@@ -100,35 +359,40 @@ class CompanySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at', 'deleted_at',
                            'contact_count', 'total_deal_value', 'industry_display',
                            'company_size_display']
-    
+        validators = [
+            # Matches the conditional unique_company_name_email constraint,
+            # which only applies to rows with a non-empty email
+            ConditionalUniqueTogetherValidator(
+                queryset=Company.objects.all(),
+                fields=['email', 'name'],
+                message='A company with this email and name already exists.'
+            )
+        ]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Batch the deals this renders.
+
+        active_deals serves from one prefetch instead of a per-company
+        filter; the aggregate numbers are denormalized columns already.
+        """
+        return queryset.with_active_deals()
+
     def validate(self, data):
         """Custom validation for company data"""
         # Validate website format
         website = data.get('website', '')
         if website and not website.startswith(('http://', 'https://')):
             data['website'] = f'https://{website}'
-        
+
         # Validate phone format
         phone = data.get('phone', '')
         if phone:
-            import re
-            phone_pattern = r'^\+?1?\d{9,15}$'
-            if not re.match(phone_pattern, phone.replace(' ', '').replace('-', '')):
+            if not _PHONE_RE.match(normalize_phone(phone)):
                 raise serializers.ValidationError({
                     'phone': 'Enter a valid phone number (e.g., +1234567890)'
                 })
-        
-        # Validate email uniqueness with name
-        if data.get('email') and data.get('name'):
-            existing = Company.objects.filter(
-                email=data['email'],
-                name=data['name']
-            ).exclude(pk=self.instance.pk if self.instance else None)
-            if existing.exists():
-                raise serializers.ValidationError({
-                    'email': 'A company with this email and name already exists.'
-                })
-        
+
         return data
     
     def create(self, validated_data):
@@ -142,32 +406,32 @@ class CompanySerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class ContactSerializer(serializers.ModelSerializer):
+class ContactSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Main contact serializer with full details"""
-    id = serializers.UUIDField(read_only=True, default=uuid.uuid4)
-    full_name = serializers.SerializerMethodField(read_only=True)
-    salutation_display = serializers.CharField(source='get_salutation_display', read_only=True)
-    source_display = serializers.CharField(source='get_source_display', read_only=True)
+    id = serializers.UUIDField(source='public_id', read_only=True)
+    full_name = serializers.ReadOnlyField()
+    salutation_display = ChoiceDisplayField(_SALUTATION_DISPLAY, source='salutation')
+    source_display = ChoiceDisplayField(_SOURCE_DISPLAY, source='source')
     age = serializers.IntegerField(read_only=True)
     company_details = CompanyNestedSerializer(source='company', read_only=True)
-    created_by = UserSimpleSerializer(read_only=True)
-    assigned_to = UserSimpleSerializer(read_only=True)
+    created_by = UserSimpleField()
+    assigned_to = UserSimpleField()
     
     # For write operations
-    company_id = serializers.PrimaryKeyRelatedField(
+    company_id = CheapPKField(
         queryset=Company.objects.all(),
         write_only=True,
         source='company',
         required=False,
         allow_null=True
     )
-    created_by_id = serializers.PrimaryKeyRelatedField(
+    created_by_id = CheapPKField(
         queryset=User.objects.all(),
         write_only=True,
         source='created_by',
         required=False
     )
-    assigned_to_id = serializers.PrimaryKeyRelatedField(
+    assigned_to_id = CheapPKField(
         queryset=User.objects.all(),
         write_only=True,
         source='assigned_to',
@@ -189,40 +453,31 @@ class ContactSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at', 'deleted_at',
                            'full_name', 'age', 'salutation_display', 'source_display']
         extra_kwargs = {
-            'email': {'validators': []}  # We'll handle uniqueness in validate
+            'email': {'validators': []}  # Uniqueness is per company, not global
         }
-    
-    def get_full_name(self, obj):
-        return obj.full_name
-    
+        validators = [
+            # Matches the conditional unique_contact_email_company
+            # constraint; contacts without a company are exempt.
+            # Declared explicitly because DRF cannot derive a validator
+            # from the constraint while both company and company_id map
+            # to the same model field.
+            ConditionalUniqueTogetherValidator(
+                queryset=Contact.objects.all(),
+                fields=['email', 'company_id'],
+                message='A contact with this email already exists at this company.'
+            )
+        ]
+
     def validate(self, data):
         """Custom validation for contact data"""
         # Validate phone numbers
-        import re
-        phone_fields = ['phone', 'mobile']
-        for field_name in phone_fields:
+        for field_name in ('phone', 'mobile'):
             if field_name in data and data[field_name]:
-                phone_pattern = r'^\+?1?\d{9,15}$'
-                phone_value = data[field_name].replace(' ', '').replace('-', '')
-                if not re.match(phone_pattern, phone_value):
+                if not _PHONE_RE.match(normalize_phone(data[field_name])):
                     raise serializers.ValidationError({
                         field_name: 'Enter a valid phone number (e.g., +1234567890)'
                     })
-        
-        # Validate email uniqueness with company
-        email = data.get('email')
-        company = data.get('company')
-        
-        if email and company:
-            existing = Contact.objects.filter(
-                email=email,
-                company=company
-            ).exclude(pk=self.instance.pk if self.instance else None)
-            if existing.exists():
-                raise serializers.ValidationError({
-                    'email': 'A contact with this email already exists at this company.'
-                })
-        
+
         return data
     
     def create(self, validated_data):
@@ -236,52 +491,52 @@ class ContactSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class DealSerializer(serializers.ModelSerializer):
+class DealSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Main deal serializer with full details"""
-    id = serializers.UUIDField(read_only=True, default=uuid.uuid4)
+    id = serializers.UUIDField(source='public_id', read_only=True)
     deal_code = serializers.CharField(read_only=True)  # Auto-generated
-    stage_display = serializers.CharField(source='get_stage_display', read_only=True)
-    currency_display = serializers.CharField(source='get_currency_display', read_only=True)
-    lost_reason_display = serializers.CharField(source='get_lost_reason_display', read_only=True)
-    forecast_category_display = serializers.CharField(source='get_forecast_category_display', read_only=True)
-    weighted_amount = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True)
+    stage_display = ChoiceDisplayField(_STAGE_DISPLAY, source='stage')
+    currency_display = ChoiceDisplayField(_CURRENCY_DISPLAY, source='currency')
+    lost_reason_display = ChoiceDisplayField(_LOST_REASON_DISPLAY, source='lost_reason')
+    forecast_category_display = ChoiceDisplayField(_FORECAST_CATEGORY_DISPLAY, source='forecast_category')
+    weighted_amount = MoneyField()
     days_in_stage = serializers.IntegerField(read_only=True)
     is_closed = serializers.BooleanField(read_only=True)
     
     # Nested relationships
     company_details = CompanyNestedSerializer(source='company', read_only=True)
     contact_details = ContactNestedSerializer(source='contact', read_only=True)
-    created_by = UserSimpleSerializer(read_only=True)
-    assigned_to = UserSimpleSerializer(read_only=True)
+    created_by = UserSimpleField()
+    assigned_to = UserSimpleField()
     team_members = UserSimpleSerializer(many=True, read_only=True)
     
     # For write operations
-    company_id = serializers.PrimaryKeyRelatedField(
+    company_id = CheapPKField(
         queryset=Company.objects.filter(is_active=True),
         write_only=True,
         source='company'
     )
-    contact_id = serializers.PrimaryKeyRelatedField(
+    contact_id = CheapPKField(
         queryset=Contact.objects.filter(is_active=True),
         write_only=True,
         source='contact',
         required=False,
         allow_null=True
     )
-    created_by_id = serializers.PrimaryKeyRelatedField(
+    created_by_id = CheapPKField(
         queryset=User.objects.all(),
         write_only=True,
         source='created_by',
         required=False
     )
-    assigned_to_id = serializers.PrimaryKeyRelatedField(
+    assigned_to_id = CheapPKField(
         queryset=User.objects.all(),
         write_only=True,
         source='assigned_to',
         required=False,
         allow_null=True
     )
-    team_member_ids = serializers.PrimaryKeyRelatedField(
+    team_member_ids = CheapPKField(
         queryset=User.objects.all(),
         write_only=True,
         source='team_members',
@@ -309,27 +564,27 @@ class DealSerializer(serializers.ModelSerializer):
             'forecast_category_display', 'weighted_amount', 'days_in_stage',
             'is_closed'
         ]
-    
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the FK rows, batch team_members, annotate days_in_stage."""
+        return queryset.select_related(
+            'company', 'contact', 'assigned_to', 'created_by'
+        ).prefetch_related('team_members').with_days_in_stage()
+
     def validate(self, data):
         """Custom validation for deal data"""
-        from django.utils import timezone
-        
         # Validate probability based on stage
-        stage = data.get('stage', self.instance.stage if self.instance else 'lead')
+        new_stage = data.get('stage', _MISSING)
+        if new_stage is not _MISSING:
+            stage = new_stage
+        else:
+            stage = self.instance.stage if self.instance else 'lead'
         probability = data.get('probability', self.instance.probability if self.instance else 0)
-        
-        stage_probability_map = {
-            'lead': (0, 30),
-            'qualified': (30, 50),
-            'proposal': (50, 70),
-            'negotiation': (70, 90),
-            'closed_won': (95, 100),
-            'closed_lost': (0, 5),
-            'on_hold': (0, 100),
-        }
-        
-        if stage in stage_probability_map:
-            min_prob, max_prob = stage_probability_map[stage]
+
+        bounds = _STAGE_PROB_BOUNDS.get(stage)
+        if bounds is not None:
+            min_prob, max_prob = bounds
             if not (min_prob <= probability <= max_prob):
                 raise serializers.ValidationError({
                     'probability': f'Probability should be between {min_prob}-{max_prob}% for {stage} stage'
@@ -344,9 +599,23 @@ class DealSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError({
                     'actual_close_date': 'Actual close date cannot be before expected close date'
                 })
-        
+
+        # Closed deals must carry a close date (the deal_closed_has_date
+        # constraint); default to today when the caller omits it, the
+        # same way Task.save fills completed_date
+        if stage in ('closed_won', 'closed_lost') and not actual_close:
+            already_set = (
+                self.instance is not None
+                and self.instance.actual_close_date is not None
+                and 'actual_close_date' not in data
+            )
+            if not already_set:
+                data['actual_close_date'] = timezone.now().date()
+
         # Auto-update last_contact_date if stage changes
-        if 'stage' in data and data['stage'] != getattr(self.instance, 'stage', None):
+        if new_stage is not _MISSING and (
+            self.instance is None or new_stage != self.instance.stage
+        ):
             data['last_contact_date'] = timezone.now().date()
         
         return data
@@ -364,34 +633,83 @@ class DealSerializer(serializers.ModelSerializer):
         
         # Create deal instance
         deal = super().create(validated_data)
-        
-        # Add team members
+
+        # Add team members: the deal is new so there is nothing to
+        # diff; one multi-row INSERT against the through table
         if team_members:
-            deal.team_members.set(team_members)
-        
+            through = Deal.team_members.through
+            through.objects.bulk_create(
+                [through(deal_id=deal.pk, user_id=user.pk) for user in team_members]
+            )
+
         return deal
-    
+
     def update(self, instance, validated_data):
         """Handle deal update with team members"""
         # Extract team members for ManyToMany handling
         team_members = validated_data.pop('team_members', None)
-        
+
         # Update deal instance
         deal = super().update(instance, validated_data)
-        
+
         # Update team members if provided
         if team_members is not None:
-            deal.team_members.set(team_members)
-        
+            self._set_team_members(deal, team_members)
+
         return deal
 
+    @staticmethod
+    def _set_team_members(deal, team_members):
+        """Diff and write the through rows directly.
+
+        team_members.set() works too, but round-trips its own SELECT of
+        current ids and dispatches m2m_changed per batch; nothing in
+        this app listens to those signals, so the diff is applied as at
+        most one bulk_create and one filtered DELETE.
+        """
+        through = Deal.team_members.through
+        wanted = {user.pk for user in team_members}
+        current = set(
+            through.objects.filter(deal_id=deal.pk).values_list('user_id', flat=True)
+        )
+        to_add = wanted - current
+        to_remove = current - wanted
+        if to_add:
+            through.objects.bulk_create(
+                [through(deal_id=deal.pk, user_id=pk) for pk in to_add],
+                ignore_conflicts=True,
+            )
+        if to_remove:
+            through.objects.filter(
+                deal_id=deal.pk, user_id__in=to_remove
+            ).delete()
+
+
+class ParentTaskField(serializers.ReadOnlyField):
+    """Parent-task summary built from the joined row.
+
+    The method-field version traversed the FK (a query per task unless
+    the view remembered to join) and went through get_status_display();
+    this reads the select_related('parent_task') row and the precomputed
+    label map.
+    """
+
+    @_memo_per_request
+    def to_representation(self, parent):
+        return {
+            'id': parent.public_id,
+            'title': parent.title,
+            'status': parent.status,
+            'status_display': _TASK_STATUS_DISPLAY.get(parent.status, parent.status),
+        }
+
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Main task serializer with full details"""
-    id = serializers.UUIDField(read_only=True, default=uuid.uuid4)
-    task_type_display = serializers.CharField(source='get_task_type_display', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
-    priority_display = serializers.CharField(source='get_priority_display', read_only=True)
+    id = serializers.UUIDField(source='public_id', read_only=True)
+    task_type_display = ChoiceDisplayField(_TASK_TYPE_DISPLAY, source='task_type')
+    status_display = ChoiceDisplayField(_TASK_STATUS_DISPLAY, source='status')
+    priority_display = ChoiceDisplayField(_TASK_PRIORITY_DISPLAY, source='priority')
     is_overdue = serializers.BooleanField(read_only=True)
     days_overdue = serializers.IntegerField(read_only=True)
     completion_rate = serializers.FloatField(read_only=True)
@@ -400,86 +718,85 @@ class TaskSerializer(serializers.ModelSerializer):
     contact_details = ContactNestedSerializer(source='contact', read_only=True)
     deal_details = DealNestedSerializer(source='deal', read_only=True)
     company_details = CompanyNestedSerializer(source='company', read_only=True)
-    assigned_to = UserSimpleSerializer(read_only=True)
-    created_by = UserSimpleSerializer(read_only=True)
-    parent_task_details = serializers.SerializerMethodField()
+    assigned_to = UserSimpleField()
+    created_by = UserSimpleField()
+    parent_task_details = ParentTaskField(source='parent_task')
     
     # For write operations
-    contact_id = serializers.PrimaryKeyRelatedField(
+    contact_id = CheapPKField(
         queryset=Contact.objects.filter(is_active=True),
         write_only=True,
         source='contact',
         required=False,
         allow_null=True
     )
-    deal_id = serializers.PrimaryKeyRelatedField(
+    deal_id = CheapPKField(
         queryset=Deal.objects.filter(is_active=True),
         write_only=True,
         source='deal',
         required=False,
         allow_null=True
     )
-    company_id = serializers.PrimaryKeyRelatedField(
+    company_id = CheapPKField(
         queryset=Company.objects.filter(is_active=True),
         write_only=True,
         source='company',
         required=False,
         allow_null=True
     )
-    assigned_to_id = serializers.PrimaryKeyRelatedField(
+    assigned_to_id = CheapPKField(
         queryset=User.objects.all(),
         write_only=True,
         source='assigned_to',
         required=False,
         allow_null=True
     )
-    created_by_id = serializers.PrimaryKeyRelatedField(
+    created_by_id = CheapPKField(
         queryset=User.objects.all(),
         write_only=True,
         source='created_by',
         required=False
     )
-    parent_task_id = serializers.PrimaryKeyRelatedField(
+    parent_task_id = CheapPKField(
         queryset=Task.objects.filter(is_active=True),
         write_only=True,
         source='parent_task',
         required=False,
         allow_null=True
     )
-    
+    # Uploads are deduplicated by content hash; reads expose the file URL
+    attachment = serializers.FileField(write_only=True, required=False, allow_null=True)
+    attachment_url = serializers.SerializerMethodField(read_only=True)
+
     class Meta:
         model = Task
         fields = [
             'id', 'title', 'description', 'task_type', 'task_type_display',
             'status', 'status_display', 'priority', 'priority_display',
-            'due_date', 'completed_date', 'estimated_hours', 'actual_hours',
+            'due_date', 'completed_date', 'completion_notes',
+            'estimated_hours', 'actual_hours',
             'contact', 'contact_id', 'contact_details', 'deal', 'deal_id',
             'deal_details', 'company', 'company_id', 'company_details',
             'assigned_to', 'assigned_to_id', 'created_by', 'created_by_id',
             'recurrence_pattern', 'parent_task', 'parent_task_id', 'parent_task_details',
-            'tags', 'attachment', 'is_active', 'deleted_at', 'created_at',
-            'updated_at', 'is_overdue', 'days_overdue', 'completion_rate'
+            'tags', 'attachment', 'attachment_url', 'is_active', 'deleted_at',
+            'created_at', 'updated_at', 'is_overdue', 'days_overdue',
+            'completion_rate'
         ]
         read_only_fields = [
             'id', 'created_at', 'updated_at', 'deleted_at',
             'task_type_display', 'status_display', 'priority_display',
             'is_overdue', 'days_overdue', 'completion_rate'
         ]
-    
-    def get_parent_task_details(self, obj):
-        if obj.parent_task:
-            return {
-                'id': obj.parent_task.id,
-                'title': obj.parent_task.title,
-                'status': obj.parent_task.status,
-                'status_display': obj.parent_task.get_status_display()
-            }
-        return None
-    
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Annotate the metrics and join the parent task this renders;
+        the other FK joins come from the default manager."""
+        return queryset.with_metrics().select_related('parent_task')
+
     def validate(self, data):
         """Custom validation for task data"""
-        from django.utils import timezone
-        
         # Validate due date
         due_date = data.get('due_date')
         status = data.get('status', getattr(self.instance, 'status', 'pending'))
@@ -505,6 +822,19 @@ class TaskSerializer(serializers.ModelSerializer):
         
         return data
     
+    def get_attachment_url(self, obj):
+        if obj.attachment_id:
+            return obj.attachment.file.url
+        return None
+
+    def _resolve_attachment(self, validated_data):
+        """Swap an uploaded file for its content-addressed Attachment row"""
+        if 'attachment' in validated_data:
+            upload = validated_data['attachment']
+            validated_data['attachment'] = (
+                Attachment.from_uploaded_file(upload) if upload else None
+            )
+
     def create(self, validated_data):
         """Handle task creation"""
         # Set created_by to current user if not specified
@@ -512,20 +842,31 @@ class TaskSerializer(serializers.ModelSerializer):
         if request and request.user.is_authenticated:
             if 'created_by' not in validated_data:
                 validated_data['created_by'] = request.user
-        
+
+        self._resolve_attachment(validated_data)
         return super().create(validated_data)
 
+    def update(self, instance, validated_data):
+        self._resolve_attachment(validated_data)
+        return super().update(instance, validated_data)
+
 
 # Supporting model serializers
 class InteractionSerializer(serializers.ModelSerializer):
     """Serializer for interaction tracking"""
-    id = serializers.UUIDField(read_only=True, default=uuid.uuid4)
-    interaction_type_display = serializers.CharField(source='get_interaction_type_display', read_only=True)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the rows the *_details and created_by fields render."""
+        return queryset.select_related('contact', 'company', 'deal', 'created_by')
+
+    id = serializers.UUIDField(source='public_id', read_only=True)
+    interaction_type_display = ChoiceDisplayField(_INTERACTION_TYPE_DISPLAY, source='interaction_type')
     
     contact_details = ContactNestedSerializer(source='contact', read_only=True)
     company_details = CompanyNestedSerializer(source='company', read_only=True)
     deal_details = DealNestedSerializer(source='deal', read_only=True)
-    created_by = UserSimpleSerializer(read_only=True)
+    created_by = UserSimpleField()
     
     class Meta:
         model = Interaction
@@ -542,10 +883,17 @@ class InteractionSerializer(serializers.ModelSerializer):
 
 class DealStageHistorySerializer(serializers.ModelSerializer):
     """Serializer for deal stage change history"""
-    id = serializers.UUIDField(read_only=True, default=uuid.uuid4)
-    from_stage_display = serializers.CharField(source='get_from_stage_display', read_only=True)
-    to_stage_display = serializers.CharField(source='get_to_stage_display', read_only=True)
-    changed_by = UserSimpleSerializer(read_only=True)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the user row changed_by renders; the model's default
+        manager does no pre-joining of its own."""
+        return queryset.select_related('changed_by')
+
+    id = serializers.UUIDField(source='public_id', read_only=True)
+    from_stage_display = ChoiceDisplayField(_STAGE_DISPLAY, source='from_stage')
+    to_stage_display = ChoiceDisplayField(_STAGE_DISPLAY, source='to_stage')
+    changed_by = UserSimpleField()
     
     class Meta:
         model = DealStageHistory
@@ -580,8 +928,8 @@ class DashboardStatsSerializer(serializers.Serializer):
     total_contacts = serializers.IntegerField()
     total_deals = serializers.IntegerField()
     total_tasks = serializers.IntegerField()
-    active_deals_value = serializers.DecimalField(max_digits=15, decimal_places=2)
-    weighted_deals_value = serializers.DecimalField(max_digits=15, decimal_places=2)
+    active_deals_value = MoneyField()
+    weighted_deals_value = MoneyField()
     overdue_tasks = serializers.IntegerField()
     pending_tasks = serializers.IntegerField()
     
@@ -596,9 +944,12 @@ class DashboardStatsSerializer(serializers.Serializer):
 
 
 # List serializers for optimized responses
-class CompanyListSerializer(serializers.ModelSerializer):
+class CompanyListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Optimized serializer for company lists"""
-    industry_display = serializers.CharField(source='get_industry_display', read_only=True)
+    id = serializers.UUIDField(source='public_id', read_only=True)
+    industry_display = ChoiceDisplayField(_INDUSTRY_DISPLAY, source='industry')
+    # Denormalized column maintained by signals.py; no join or
+    # annotation needed at read time
     contact_count = serializers.IntegerField(read_only=True)
     
     class Meta:
@@ -610,11 +961,27 @@ class CompanyListSerializer(serializers.ModelSerializer):
         ]
 
 
-class ContactListSerializer(serializers.ModelSerializer):
+def _contact_full_name(salutation, first_name, last_name):
+    """Mirror Contact.full_name from raw column values."""
+    if salutation:
+        label = _SALUTATION_DISPLAY.get(salutation, salutation)
+        return f"{label} {first_name} {last_name}"
+    return f"{first_name} {last_name}"
+
+
+class ContactListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Optimized serializer for contact lists"""
-    full_name = serializers.SerializerMethodField()
+
+    id = serializers.UUIDField(source='public_id', read_only=True)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the company row company_name renders from."""
+        return queryset.select_related('company')
+
+    full_name = serializers.ReadOnlyField()
     company_name = serializers.CharField(source='company.name', read_only=True)
-    
+
     class Meta:
         model = Contact
         fields = [
@@ -622,14 +989,56 @@ class ContactListSerializer(serializers.ModelSerializer):
             'company', 'company_name', 'is_decision_maker', 'is_active',
             'created_at', 'updated_at'
         ]
-    
-    def get_full_name(self, obj):
-        return obj.full_name
 
+    # Columns the fast list path selects; the join happens inside
+    # .values() so no instances are ever built.
+    fast_list_fields = (
+        'public_id', 'salutation', 'first_name', 'last_name', 'email', 'phone',
+        'position', 'company', 'company__name', 'is_decision_maker',
+        'is_active', 'created_at', 'updated_at',
+    )
+
+    @classmethod
+    def fast_list(cls, rows):
+        """Render .values() rows straight to output dicts.
+
+        One dict build per row instead of a field-by-field serializer
+        walk. Matches to_representation(): company_name is omitted for
+        contacts without a company, the way the bound CharField skips.
+        """
+        out = []
+        for row in rows:
+            data = {
+                'id': row['public_id'],
+                'full_name': _contact_full_name(
+                    row['salutation'], row['first_name'], row['last_name']
+                ),
+                'email': row['email'],
+                'phone': row['phone'],
+                'position': row['position'],
+                'company': row['company'],
+                'is_decision_maker': row['is_decision_maker'],
+                'is_active': row['is_active'],
+                'created_at': row['created_at'],
+                'updated_at': row['updated_at'],
+            }
+            if row['company'] is not None:
+                data['company_name'] = row['company__name']
+            out.append(data)
+        return out
 
-class DealListSerializer(serializers.ModelSerializer):
+
+class DealListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Optimized serializer for deal lists"""
-    stage_display = serializers.CharField(source='get_stage_display', read_only=True)
+
+    id = serializers.UUIDField(source='public_id', read_only=True)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the rows company_name and contact_name render from."""
+        return queryset.select_related('company', 'contact')
+
+    stage_display = ChoiceDisplayField(_STAGE_DISPLAY, source='stage')
     company_name = serializers.CharField(source='company.name', read_only=True)
     contact_name = serializers.CharField(source='contact.full_name', read_only=True)
     
@@ -642,11 +1051,63 @@ class DealListSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
 
+    fast_list_fields = (
+        'public_id', 'deal_code', 'title', 'amount', 'currency', 'stage',
+        'probability', 'company', 'company__name', 'contact',
+        'contact__salutation', 'contact__first_name', 'contact__last_name',
+        'expected_close_date', 'is_active', 'created_at', 'updated_at',
+    )
+
+    @classmethod
+    def fast_list(cls, rows):
+        """Render .values() rows straight to output dicts.
+
+        amount is formatted to two places to match what the bound
+        DecimalField would emit; contact_name is omitted for deals
+        without a contact, the way the bound CharField skips.
+        """
+        out = []
+        for row in rows:
+            stage = row['stage']
+            data = {
+                'id': row['public_id'],
+                'deal_code': row['deal_code'],
+                'title': row['title'],
+                'amount': f"{row['amount']:.2f}",
+                'currency': row['currency'],
+                'stage': stage,
+                'stage_display': _STAGE_DISPLAY.get(stage, stage),
+                'probability': row['probability'],
+                'company': row['company'],
+                'company_name': row['company__name'],
+                'contact': row['contact'],
+                'expected_close_date': row['expected_close_date'],
+                'is_active': row['is_active'],
+                'created_at': row['created_at'],
+                'updated_at': row['updated_at'],
+            }
+            if row['contact'] is not None:
+                data['contact_name'] = _contact_full_name(
+                    row['contact__salutation'],
+                    row['contact__first_name'],
+                    row['contact__last_name'],
+                )
+            out.append(data)
+        return out
+
 
-class TaskListSerializer(serializers.ModelSerializer):
+class TaskListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Optimized serializer for task lists"""
-    priority_display = serializers.CharField(source='get_priority_display', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+
+    id = serializers.UUIDField(source='public_id', read_only=True)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the user row assigned_to_name renders from."""
+        return queryset.select_related('assigned_to')
+
+    priority_display = ChoiceDisplayField(_TASK_PRIORITY_DISPLAY, source='priority')
+    status_display = ChoiceDisplayField(_TASK_STATUS_DISPLAY, source='status')
     assigned_to_name = serializers.CharField(source='assigned_to.get_full_name', read_only=True)
     is_overdue = serializers.BooleanField(read_only=True)
     
@@ -658,3 +1119,49 @@ class TaskListSerializer(serializers.ModelSerializer):
             'assigned_to_name', 'is_overdue', 'is_active', 'created_at',
             'updated_at'
         ]
+
+    fast_list_fields = (
+        'public_id', 'title', 'task_type', 'priority', 'status', 'due_date',
+        'assigned_to', 'assigned_to__first_name', 'assigned_to__last_name',
+        'is_active', 'created_at', 'updated_at',
+    )
+
+    @classmethod
+    def fast_list(cls, rows):
+        """Render .values() rows straight to output dicts.
+
+        is_overdue mirrors the model property against a single
+        timezone.now() for the whole page; assigned_to_name is omitted
+        for unassigned tasks, the way the bound CharField skips.
+        """
+        now = timezone.now()
+        out = []
+        for row in rows:
+            priority = row['priority']
+            status = row['status']
+            due_date = row['due_date']
+            data = {
+                'id': row['public_id'],
+                'title': row['title'],
+                'task_type': row['task_type'],
+                'priority': priority,
+                'priority_display': _TASK_PRIORITY_DISPLAY.get(priority, priority),
+                'status': status,
+                'status_display': _TASK_STATUS_DISPLAY.get(status, status),
+                'due_date': due_date,
+                'assigned_to': row['assigned_to'],
+                'is_overdue': bool(
+                    due_date
+                    and status not in _TERMINAL_TASK_STATUSES
+                    and due_date < now
+                ),
+                'is_active': row['is_active'],
+                'created_at': row['created_at'],
+                'updated_at': row['updated_at'],
+            }
+            if row['assigned_to'] is not None:
+                first = row['assigned_to__first_name']
+                last = row['assigned_to__last_name']
+                data['assigned_to_name'] = f"{first} {last}".strip()
+            out.append(data)
+        return out
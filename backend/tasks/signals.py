@@ -0,0 +1,89 @@
+# backend/tasks/signals.py
+
+"""Receivers maintaining the denormalized Company aggregate columns
+and invalidating cached dashboard payloads.
+
+contact_count, deal_count, active_deal_count and total_deal_value live
+on Company so lists and dashboards read them without joining the
+contact/deal tables. Every contact or deal write funnels through these
+receivers, which recompute the affected company rows in one UPDATE via
+CompanyQuerySet.refresh_aggregates. Bulk ingestion through the bulk
+managers bypasses signals entirely; importers are responsible for
+calling refresh_aggregates with the company pks they touched.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Company, Contact, Deal, Interaction, Task
+
+_DASHBOARD_GENERATION_KEY = 'dashboard_stats:gen'
+
+
+def dashboard_cache_key(user_pk):
+    """Current cache key for a user's dashboard payload.
+
+    The generation counter namespaces every dashboard key, so bumping
+    it orphans all cached dashboards at once; there is no need to
+    enumerate per-user keys (delete_pattern is Redis-specific and the
+    default cache backend has no equivalent).
+    """
+    gen = cache.get(_DASHBOARD_GENERATION_KEY)
+    if gen is None:
+        cache.add(_DASHBOARD_GENERATION_KEY, 1, None)
+        gen = cache.get(_DASHBOARD_GENERATION_KEY, 1)
+    return f'dashboard_stats:{gen}:{user_pk}'
+
+
+def _refresh(*company_pks):
+    Company.objects.refresh_aggregates({pk for pk in company_pks if pk})
+
+
+@receiver(pre_save, sender=Contact)
+@receiver(pre_save, sender=Deal)
+def stash_previous_company(sender, instance, **kwargs):
+    """Remember the previous company so a reassignment refreshes both."""
+    if instance.pk:
+        instance._previous_company_id = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list('company_id', flat=True)
+            .first()
+        )
+    else:
+        instance._previous_company_id = None
+
+
+@receiver(post_save, sender=Contact)
+@receiver(post_save, sender=Deal)
+def refresh_on_save(sender, instance, **kwargs):
+    _refresh(
+        instance.company_id,
+        getattr(instance, '_previous_company_id', None),
+    )
+
+
+@receiver(post_delete, sender=Contact)
+@receiver(post_delete, sender=Deal)
+def refresh_on_delete(sender, instance, **kwargs):
+    _refresh(instance.company_id)
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Contact)
+@receiver(post_save, sender=Deal)
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Interaction)
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Contact)
+@receiver(post_delete, sender=Deal)
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Interaction)
+def invalidate_dashboards(sender, **kwargs):
+    """Drop every cached dashboard when any of its source tables change."""
+    try:
+        cache.incr(_DASHBOARD_GENERATION_KEY)
+    except ValueError:
+        # Counter not in the cache yet; the next dashboard_cache_key
+        # call seeds it, and there is nothing cached under it to drop.
+        pass
@@ -0,0 +1,32 @@
+# backend/tasks/utils.py
+
+import os
+import time
+import uuid
+
+# Separators tolerated in user-entered phone numbers.
+_PHONE_STRIP = str.maketrans('', '', ' -')
+
+
+def normalize_phone(value):
+    """Strip spaces and dashes so phone numbers compare and index cleanly."""
+    return (value or '').translate(_PHONE_STRIP)
+
+
+def uuid7():
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    Unlike uuid4, the leading 48 bits are a millisecond Unix timestamp, so
+    freshly generated values sort after existing ones. New rows therefore
+    land at the tail of the unique index instead of at random leaf pages,
+    which keeps inserts cache-hot and avoids B-tree page splits.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+
+    value = timestamp_ms << 80
+    value |= 0x7 << 76                      # version 7
+    value |= (rand >> 68) << 64             # 12 bits rand_a
+    value |= 0b10 << 62                     # RFC 4122 variant
+    value |= rand & ((1 << 62) - 1)         # 62 bits rand_b
+    return uuid.UUID(int=value)